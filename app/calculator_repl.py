@@ -2,51 +2,208 @@
 # Calculator REPL       #
 ########################
 
-from decimal import Decimal
+import io
 import logging
-
-from colorama import init, Fore, Back, Style
+from operator import methodcaller
+import sys
+from typing import Callable, Dict, Final, FrozenSet, Tuple
 
 from app.calculator import Calculator
+from app.colors import Fore, Style
 from app.exceptions import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
 from app.operations import OperationFactory
 from app.command_pattern import CommandRegistry, OperationCommand, HistoryCommand, FileCommand
 from app.help_decorator import HelpMenuBuilder
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+
+# Resolved color prefixes, bound once so render paths skip the dict lookup
+_C_HEADER: Final[str] = Fore.CYAN + Style.BRIGHT
+_C_SUCCESS: Final[str] = Fore.GREEN + Style.BRIGHT
+_C_ERROR: Final[str] = Fore.RED + Style.BRIGHT
+_C_WARNING: Final[str] = Fore.YELLOW + Style.BRIGHT
+_C_INFO: Final[str] = Fore.BLUE + Style.BRIGHT
+_C_PROMPT: Final[str] = Fore.CYAN + Style.BRIGHT
+_C_RESULT: Final[str] = Fore.YELLOW + Style.BRIGHT
+_C_HIGHLIGHT: Final[str] = Fore.MAGENTA + Style.BRIGHT
+_C_NORMAL: Final[str] = Fore.WHITE
+_C_DIM: Final[str] = Fore.WHITE + Style.DIM
+
+# Box-drawing segments shared by every rendered frame, built once at import
+_EQ48: Final[str] = '═' * 48
+_EQ50: Final[str] = '═' * 50
+_EQ60: Final[str] = '═' * 60
+_SP50: Final[str] = ' ' * 50
+_SP60: Final[str] = ' ' * 60
+
+# Fully-formed border lines that do not depend on runtime values
+_HEADER_TOP_50: Final[str] = f"{_C_HEADER}╔{_EQ50}╗"
+_HEADER_BLANK_50: Final[str] = f"{_C_HEADER}║{_SP50}║"
+_HEADER_BOTTOM_50: Final[str] = f"{_C_HEADER}╚{_EQ50}╝{Style.RESET_ALL}"
+_HEADER_TOP_48: Final[str] = f"{_C_HEADER}╔{_EQ48}╗"
+_HEADER_BOTTOM_48: Final[str] = f"{_C_HEADER}╚{_EQ48}╝{Style.RESET_ALL}"
+_HIGHLIGHT_TOP_48: Final[str] = f"{_C_HIGHLIGHT}╔{_EQ48}╗"
+_HIGHLIGHT_BOTTOM_48: Final[str] = f"{_C_HIGHLIGHT}╚{_EQ48}╝{Style.RESET_ALL}"
+
+# Fully materialized input prompts per operation (color codes and ": " suffix included)
+_PROMPT_TABLE: Final[Dict[str, Tuple[str, str]]] = {
+    command: (f"{_C_PROMPT}{first}: {_C_NORMAL}", f"{_C_PROMPT}{second}: {_C_NORMAL}")
+    for command, (first, second) in {
+        'percentage': ("💯 Value", "📊 Total (base)"),
+        'root': ("🔢 Number", "📐 Root degree (n)"),
+        'power': ("🔢 Base", "⚡ Exponent"),
+        'modulus': ("🔢 Dividend", "➗ Divisor"),
+        'intdiv': ("🔢 Dividend", "➗ Divisor"),
+        'absdiff': ("🔢 First number", "🔢 Second number"),
+        'add': ("➕ First number", "➕ Second number"),
+        'subtract': ("➖ First number", "➖ Second number"),
+        'multiply': ("✖️  First number", "✖️  Second number"),
+        'divide': ("➗ Dividend", "➗ Divisor")
+    }.items()
+}
+_DEFAULT_PROMPTS: Final[Tuple[str, str]] = (
+    f"{_C_PROMPT}🔢 First number: {_C_NORMAL}",
+    f"{_C_PROMPT}🔢 Second number: {_C_NORMAL}",
+)
+
+# History rows alternate colors; templates take (index, entry)
+_ROW_EVEN: Final[str] = f"{_C_HEADER}║ {Fore.CYAN}{Style.BRIGHT}%3d.{Style.RESET_ALL} {Fore.WHITE}%-53s{_C_HEADER}║{Style.RESET_ALL}"
+_ROW_ODD: Final[str] = f"{_C_HEADER}║ {Fore.BLUE}{Style.BRIGHT}%3d.{Style.RESET_ALL} {Fore.GREEN}%-53s{_C_HEADER}║{Style.RESET_ALL}"
+
+# Static labels, padded once at import (emoji widths are fixed here)
+_LBL_WELCOME_TITLE: Final[str] = '🧮 ADVANCED CALCULATOR REPL'.center(50)
+_LBL_WELCOME_SUBTITLE: Final[str] = 'With Design Patterns & Colors!'.center(50)
+_LBL_NO_HISTORY: Final[str] = '📭 No Calculations in History'.center(48)
+_LBL_HISTORY_TITLE: Final[str] = '📜 CALCULATION HISTORY'.center(60)
+_LBL_SAVING: Final[str] = '🔄 Saving History...'.center(48)
+_LBL_THANK_YOU: Final[str] = '👋 Thank you for using Calculator!'.center(48)
+_LBL_COME_BACK: Final[str] = 'Come back soon!'.center(48)
+_LBL_ENTER_NUMBERS: Final[str] = '📝 Enter Numbers'.center(48)
+_LBL_CANCEL_HINT: Final[str] = "(or type 'cancel' to abort)".center(48)
+_LBL_CANCELLED: Final[str] = '🚫 Operation Cancelled'.center(48)
+_LBL_INPUT_TERMINATED: Final[str] = '🔚 Input Terminated'.center(48)
+_LBL_FATAL_ERROR: Final[str] = '💥 FATAL ERROR'.center(48)
+_LBL_LOOP_ERROR: Final[str] = '⚠️  ERROR'.center(48)
+
+# Error box pieces; titles carry their own trailing padding
+_ERROR_TOP: Final[str] = f"\n{_C_ERROR}╔{_EQ50}╗"
+_ERROR_BLANK: Final[str] = f"{_C_ERROR}║{_SP50}║"
+_ERROR_BOTTOM: Final[str] = f"{_C_ERROR}╚{_EQ50}╝{Style.RESET_ALL}\n"
+_ERROR_BOX_WIDTH: Final[int] = len(_EQ50)
+# Message lines are '║' + two spaces + message + one space + '║'
+_ERROR_MSG_WIDTH: Final[int] = _ERROR_BOX_WIDTH - 3
+_TITLE_ERROR: Final[str] = '❌ ERROR' + ' ' * 40
+_TITLE_UNEXPECTED_ERROR: Final[str] = '⚠️  UNEXPECTED ERROR' + ' ' * 29
+_TITLE_UNKNOWN_COMMAND: Final[str] = '❓ UNKNOWN COMMAND' + ' ' * 31
+_HELP_HINT_LINE: Final[str] = f"{_C_ERROR}║  {Fore.CYAN}💡 Type 'help' for available commands{' ' * 10} ║"
+
+# History frame pieces written around the rows, newline-terminated
+_HISTORY_FRAME_TOP: Final[str] = (
+    f"\n{_C_HEADER}╔{_EQ60}╗\n"
+    f"{_C_HEADER}║{_SP60}║\n"
+    f"{_C_HEADER}║{_C_HIGHLIGHT}{_LBL_HISTORY_TITLE}{_C_HEADER}║\n"
+    f"{_C_HEADER}║{_SP60}║\n"
+    f"{_C_HEADER}╠{_EQ60}╣{Style.RESET_ALL}\n"
+)
+_HISTORY_FRAME_BOTTOM: Final[str] = f"{_C_HEADER}╚{_EQ60}╝{Style.RESET_ALL}\n"
+
+# History command -> (HistoryCommand action, success label, nothing-to-do label)
+_HISTORY_COMMANDS: Final[Dict[str, Tuple[str, str, str]]] = {
+    'history': ('show', '📜 History displayed!'.center(48), ''),
+    'clear': ('clear', '🗑️ History cleared!'.center(48), ''),
+    'undo': ('undo', '↩️ Operation undone!'.center(48), '⚠️  Nothing to undo'.center(48)),
+    'redo': ('redo', '↪️ Operation redone!'.center(48), '⚠️  Nothing to redo'.center(48))
+}
+
+# File command -> (progress message, success label, failure label)
+_FILE_LABELS: Final[Dict[str, Tuple[str, str, str]]] = {
+    'save': ('💾 Saving history...',
+             '✅ History saved successfully!'.center(48),
+             '❌ Error saving history'.center(48)),
+    'load': ('📂 Loading history...',
+             '✅ History loaded successfully!'.center(48),
+             '❌ Error loading history'.center(48))
+}
+
+# Commands handled by handle_file_command
+_FILE_CMDS: Final[FrozenSet[str]] = frozenset({'save', 'load'})
+
+
+def _is_cancel(text: str) -> bool:
+    """
+    Check whether an operand input is the 'cancel' keyword.
+    
+    The length test rejects numeric input before any lowercased copy is made.
+    
+    Args:
+        text: Stripped user input.
+    
+    Returns:
+        bool: True if the input is 'cancel' in any letter case.
+    """
+    return len(text) == 6 and text.lower() == 'cancel'
+
+
+def _emit(*lines: str) -> None:
+    """
+    Write a block of pre-formatted lines to stdout in a single call.
+
+    Args:
+        *lines: Lines to output, joined with newlines.
+    """
+    print("\n".join(lines))
+
+
+def _emit_error(title: str, message: str, *extra: str) -> None:
+    """
+    Write a boxed error with a title line and a single message line.
+    
+    Messages longer than the box are cut and end with '...'.
+    
+    Args:
+        title: Pre-padded title text.
+        message: Error message to show under the title.
+        *extra: Additional fully formatted lines placed before the bottom border.
+    """
+    if len(message) > _ERROR_MSG_WIDTH:
+        message = message[:_ERROR_MSG_WIDTH - 3] + "..."
+    _emit(
+        _ERROR_TOP,
+        _ERROR_BLANK,
+        f"{_C_ERROR}║  {Fore.WHITE}{title} ║",
+        f"{_C_ERROR}║  {Fore.YELLOW}{message.ljust(_ERROR_MSG_WIDTH)} ║",
+        _ERROR_BLANK,
+        *extra,
+        _ERROR_BOTTOM,
+    )
 
 
 class CalculatorREPL:
     """Enhanced REPL interface for the calculator with improved organization and full color support."""
     
-    OPERATION_COMMANDS = [
+    OPERATION_COMMANDS: Final[FrozenSet[str]] = frozenset(map(sys.intern, (
         'add', 'subtract', 'multiply', 'divide', 
         'power', 'root', 'modulus', 'intdiv', 
         'percentage', 'absdiff'
-    ]
+    )))
     
     # Color scheme configuration
     COLORS = {
-        'header': Fore.CYAN + Style.BRIGHT,
-        'success': Fore.GREEN + Style.BRIGHT,
-        'error': Fore.RED + Style.BRIGHT,
-        'warning': Fore.YELLOW + Style.BRIGHT,
-        'info': Fore.BLUE + Style.BRIGHT,
-        'prompt': Fore.CYAN + Style.BRIGHT,
-        'result': Fore.YELLOW + Style.BRIGHT,
-        'highlight': Fore.MAGENTA + Style.BRIGHT,
-        'normal': Fore.WHITE,
-        'dim': Fore.WHITE + Style.DIM
+        'header': _C_HEADER,
+        'success': _C_SUCCESS,
+        'error': _C_ERROR,
+        'warning': _C_WARNING,
+        'info': _C_INFO,
+        'prompt': _C_PROMPT,
+        'result': _C_RESULT,
+        'highlight': _C_HIGHLIGHT,
+        'normal': _C_NORMAL,
+        'dim': _C_DIM
     }
     
     def __init__(self):
         """Initialize the calculator and register observers."""
-        self.calc = Calculator()
-        self.calc.add_observer(LoggingObserver())
-        self.calc.add_observer(AutoSaveObserver(self.calc))
-        self.running = True
+        self._new_calculator()
         
         # Initialize Command Pattern components
         self.command_registry = CommandRegistry()
@@ -57,88 +214,86 @@ class CalculatorREPL:
                            .with_colors()
                            .build())
     
+    def _new_calculator(self):
+        """Give the REPL a fresh Calculator with its observers and mark it running."""
+        self.calc = Calculator()
+        self.calc.add_observer(LoggingObserver())
+        self.calc.add_observer(AutoSaveObserver(self.calc))
+        self.running = True
+    
     def display_welcome(self):
         """Display colorful welcome message with ASCII art."""
-        c = self.COLORS
-        print(f"\n{c['header']}╔{'═' * 50}╗")
-        print(f"{c['header']}║{' ' * 50}║")
-        print(f"{c['header']}║{Fore.YELLOW}{Style.BRIGHT}{'🧮 ADVANCED CALCULATOR REPL'.center(50)}{c['header']}║")
-        print(f"{c['header']}║{Fore.CYAN}{'With Design Patterns & Colors!'.center(50)}{c['header']}║")
-        print(f"{c['header']}║{' ' * 50}║")
-        print(f"{c['header']}╚{'═' * 50}╝{Style.RESET_ALL}")
-        print(f"\n{c['info']}💡 Type {c['highlight']}'help'{c['info']} for available commands")
-        print(f"{c['dim']}   Type {c['highlight']}'exit'{c['dim']} to quit the calculator{Style.RESET_ALL}\n")
+        _emit(
+            f"\n{_HEADER_TOP_50}",
+            _HEADER_BLANK_50,
+            f"{_C_HEADER}║{Fore.YELLOW}{Style.BRIGHT}{_LBL_WELCOME_TITLE}{_C_HEADER}║",
+            f"{_C_HEADER}║{Fore.CYAN}{_LBL_WELCOME_SUBTITLE}{_C_HEADER}║",
+            _HEADER_BLANK_50,
+            _HEADER_BOTTOM_50,
+            f"\n{_C_INFO}💡 Type {_C_HIGHLIGHT}'help'{_C_INFO} for available commands",
+            f"{_C_DIM}   Type {_C_HIGHLIGHT}'exit'{_C_DIM} to quit the calculator{Style.RESET_ALL}\n",
+        )
     
     def display_help(self):
         """Display dynamically generated help menu using Decorator Pattern."""
-        help_text = self.help_display.display()
-        print(help_text)
+        print(self.help_display.display())
     
     def display_history(self):
         """Display calculation history in a beautifully formatted manner with colors."""
         history = self.calc.show_history()
-        c = self.COLORS
         
         if not history:
-            print(f"\n{c['warning']}╔{'═' * 48}╗") # pragma: no cover
-            print(f"{c['warning']}║{'📭 No Calculations in History'.center(48)}║") # pragma: no cover
-            print(f"{c['warning']}╚{'═' * 48}╝{Style.RESET_ALL}\n") # pragma: no cover
+            _emit(  # pragma: no cover
+                f"\n{_C_WARNING}╔{_EQ48}╗",
+                f"{_C_WARNING}║{_LBL_NO_HISTORY}║",
+                f"{_C_WARNING}╚{_EQ48}╝{Style.RESET_ALL}\n",
+            )
         else:
-            print(f"\n{c['header']}╔{'═' * 60}╗")
-            print(f"{c['header']}║{' ' * 60}║")
-            print(f"{c['header']}║{c['highlight']}{'📜 CALCULATION HISTORY'.center(60)}{c['header']}║")
-            print(f"{c['header']}║{' ' * 60}║")
-            print(f"{c['header']}╠{'═' * 60}╣{Style.RESET_ALL}")
+            # Build the whole frame in memory and write it out once
+            buf = io.StringIO()
+            buf.write(_HISTORY_FRAME_TOP)
             
             for i, entry in enumerate(history, 1):
                 # Alternate row colors for better readability
-                if i % 2 == 0:
-                    num_color = Fore.CYAN
-                    entry_color = Fore.WHITE
-                else:
-                    num_color = Fore.BLUE
-                    entry_color = Fore.GREEN
-                
-                print(f"{c['header']}║ {num_color}{Style.BRIGHT}{i:3d}.{Style.RESET_ALL} {entry_color}{entry:<53}{c['header']}║{Style.RESET_ALL}")
+                buf.write((_ROW_ODD if i & 1 else _ROW_EVEN) % (i, entry))
+                buf.write("\n")
             
-            print(f"{c['header']}╚{'═' * 60}╝{Style.RESET_ALL}")
-            print(f"{c['info']}Total calculations: {c['highlight']}{len(history)}{Style.RESET_ALL}\n")
+            buf.write(_HISTORY_FRAME_BOTTOM)
+            buf.write(f"{_C_INFO}Total calculations: {_C_HIGHLIGHT}{len(history)}{Style.RESET_ALL}\n")
+            print(buf.getvalue())
     
     def handle_exit(self):
         """Handle exit command with colorful history saving animation."""
-        c = self.COLORS
-        print(f"\n{c['header']}╔{'═' * 48}╗")
-        print(f"{c['header']}║{c['info']}{'🔄 Saving History...'.center(48)}{c['header']}║")
-        print(f"{c['header']}╚{'═' * 48}╝{Style.RESET_ALL}")
+        _emit(
+            f"\n{_HEADER_TOP_48}",
+            f"{_C_HEADER}║{_C_INFO}{_LBL_SAVING}{_C_HEADER}║",
+            _HEADER_BOTTOM_48,
+        )
         
         try:
             self.calc.save_history()
-            print(f"{c['success']}✅ History saved successfully!{Style.RESET_ALL}")
+            print(f"{_C_SUCCESS}✅ History saved successfully!{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{c['warning']}⚠️  Warning: Could not save history")
-            print(f"{c['error']}   Reason: {e}{Style.RESET_ALL}")
+            _emit(
+                f"{_C_WARNING}⚠️  Warning: Could not save history",
+                f"{_C_ERROR}   Reason: {e}{Style.RESET_ALL}",
+            )
         
-        print(f"\n{c['highlight']}╔{'═' * 48}╗")
-        print(f"{c['highlight']}║{Fore.YELLOW}{'👋 Thank you for using Calculator!'.center(48)}{c['highlight']}║")
-        print(f"{c['highlight']}║{Fore.CYAN}{'Come back soon!'.center(48)}{c['highlight']}║")
-        print(f"{c['highlight']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+        _emit(
+            f"\n{_HIGHLIGHT_TOP_48}",
+            f"{_C_HIGHLIGHT}║{Fore.YELLOW}{_LBL_THANK_YOU}{_C_HIGHLIGHT}║",
+            f"{_C_HIGHLIGHT}║{Fore.CYAN}{_LBL_COME_BACK}{_C_HIGHLIGHT}║",
+            f"{_HIGHLIGHT_BOTTOM_48}\n",
+        )
         
         self.running = False
     
     def handle_history_command(self, command):
         """Handle history-related commands using Command Pattern with colorful feedback."""
-        c = self.COLORS
-        history_commands = {
-            'history': ('show', 'History displayed', '📜'),
-            'clear': ('clear', 'History cleared', '🗑️'),
-            'undo': ('undo', 'Operation undone', '↩️'),
-            'redo': ('redo', 'Operation redone', '↪️')
-        }
-        
-        if command not in history_commands:
+        if command not in _HISTORY_COMMANDS:
             return False
         
-        action, success_msg, icon = history_commands[command]
+        action, done_label, nothing_label = _HISTORY_COMMANDS[command]
         
         if command == 'history':
             self.display_history()
@@ -149,102 +304,93 @@ class CalculatorREPL:
         hist_cmd = HistoryCommand(
             self.calc, 
             action, 
-            cmd_info['description'] if cmd_info else ''
+            cmd_info['description']
         )
         
         result = hist_cmd.execute()
         
         if command == 'clear':
-            print(f"\n{c['success']}╔{'═' * 48}╗")
-            print(f"{c['success']}║{f'{icon} {success_msg}!'.center(48)}║")
-            print(f"{c['success']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+            _emit(
+                f"\n{_C_SUCCESS}╔{_EQ48}╗",
+                f"{_C_SUCCESS}║{done_label}║",
+                f"{_C_SUCCESS}╚{_EQ48}╝{Style.RESET_ALL}\n",
+            )
         elif command in ['undo', 'redo']:
             if result:
-                print(f"\n{c['success']}╔{'═' * 48}╗")
-                print(f"{c['success']}║{f'{icon} {success_msg}!'.center(48)}║")
-                print(f"{c['success']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+                _emit(
+                    f"\n{_C_SUCCESS}╔{_EQ48}╗",
+                    f"{_C_SUCCESS}║{done_label}║",
+                    f"{_C_SUCCESS}╚{_EQ48}╝{Style.RESET_ALL}\n",
+                )
             else:
-                print(f"\n{c['warning']}╔{'═' * 48}╗")
-                print(f"{c['warning']}║{f'⚠️  Nothing to {command}'.center(48)}║")
-                print(f"{c['warning']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+                _emit(
+                    f"\n{_C_WARNING}╔{_EQ48}╗",
+                    f"{_C_WARNING}║{nothing_label}║",
+                    f"{_C_WARNING}╚{_EQ48}╝{Style.RESET_ALL}\n",
+                )
         
         return True
     
     def handle_file_command(self, command):
         """Handle file operations using Command Pattern with colorful status."""
-        c = self.COLORS
-        if command not in ['save', 'load']:
+        if command not in _FILE_CMDS:
             return False
         
         cmd_info = self.command_registry.get_command_info(command)
         file_cmd = FileCommand(
             self.calc,
             command,
-            cmd_info['description'] if cmd_info else ''
+            cmd_info['description']
         )
         
+        progress_msg, done_label, error_label = _FILE_LABELS[command]
+        
         try:
-            action_icon = '💾' if command == 'save' else '📂'
-            action_msg = 'Saving' if command == 'save' else 'Loading'
-            
-            print(f"\n{c['info']}{action_icon} {action_msg} history...{Style.RESET_ALL}")
+            print(f"\n{_C_INFO}{progress_msg}{Style.RESET_ALL}")
             file_cmd.execute()
             
-            action_done = 'saved' if command == 'save' else 'loaded'
-            print(f"{c['success']}╔{'═' * 48}╗")
-            print(f"{c['success']}║{f'✅ History {action_done} successfully!'.center(48)}║")
-            print(f"{c['success']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+            _emit(
+                f"{_C_SUCCESS}╔{_EQ48}╗",
+                f"{_C_SUCCESS}║{done_label}║",
+                f"{_C_SUCCESS}╚{_EQ48}╝{Style.RESET_ALL}\n",
+            )
         except Exception as e:
-            action = 'saving' if command == 'save' else 'loading'
-            print(f"{c['error']}╔{'═' * 48}╗")
-            print(f"{c['error']}║{f'❌ Error {action} history'.center(48)}║")
-            print(f"{c['error']}╚{'═' * 48}╝")
-            print(f"{c['warning']}Reason: {e}{Style.RESET_ALL}\n")
+            _emit(
+                f"{_C_ERROR}╔{_EQ48}╗",
+                f"{_C_ERROR}║{error_label}║",
+                f"{_C_ERROR}╚{_EQ48}╝",
+                f"{_C_WARNING}Reason: {e}{Style.RESET_ALL}\n",
+            )
         
         return True
     
     def get_operation_inputs(self, command):
         """Get and validate operation inputs with colorful, context-specific prompts."""
-        c = self.COLORS
         
-        cancel_msg = "(or type 'cancel' to abort)"
-        
-        print(f"\n{c['header']}╔{'═' * 48}╗")
-        print(f"{c['header']}║{c['info']}{'📝 Enter Numbers'.center(48)}{c['header']}║")
-        print(f"{c['header']}║{c['dim']}{cancel_msg.center(48)}{c['header']}║")
-        print(f"{c['header']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+        _emit(
+            f"\n{_C_HEADER}╔{_EQ48}╗",
+            f"{_C_HEADER}║{_C_INFO}{_LBL_ENTER_NUMBERS}{_C_HEADER}║",
+            f"{_C_HEADER}║{_C_DIM}{_LBL_CANCEL_HINT}{_C_HEADER}║",
+            f"{_C_HEADER}╚{_EQ48}╝{Style.RESET_ALL}\n",
+        )
         
         # Customize prompts based on operation with icons
-        prompts = {
-            'percentage': ("💯 Value", "📊 Total (base)"),
-            'root': ("🔢 Number", "📐 Root degree (n)"),
-            'power': ("🔢 Base", "⚡ Exponent"),
-            'modulus': ("🔢 Dividend", "➗ Divisor"),
-            'intdiv': ("🔢 Dividend", "➗ Divisor"),
-            'absdiff': ("🔢 First number", "🔢 Second number"),
-            'add': ("➕ First number", "➕ Second number"),
-            'subtract': ("➖ First number", "➖ Second number"),
-            'multiply': ("✖️  First number", "✖️  Second number"),
-            'divide': ("➗ Dividend", "➗ Divisor")
-        }
-        
-        prompt1, prompt2 = prompts.get(command, ("🔢 First number", "🔢 Second number"))
+        prompt1, prompt2 = _PROMPT_TABLE.get(command, _DEFAULT_PROMPTS)
         
-        a = input(f"{c['prompt']}{prompt1}: {c['normal']}").strip()
-        if a.lower() == 'cancel':
-            print(f"\n{c['warning']}🚫 Operation cancelled{Style.RESET_ALL}\n")
+        a = input(prompt1).strip()
+        if _is_cancel(a):
+            print(f"\n{_C_WARNING}🚫 Operation cancelled{Style.RESET_ALL}\n")
             return None, None
         
-        b = input(f"{c['prompt']}{prompt2}: {c['normal']}").strip()
-        if b.lower() == 'cancel':
-            print(f"\n{c['warning']}🚫 Operation cancelled{Style.RESET_ALL}\n")
+        b = input(prompt2).strip()
+        if _is_cancel(b):
+            print(f"\n{_C_WARNING}🚫 Operation cancelled{Style.RESET_ALL}\n")
             return None, None
         
         return a, b
     
     def handle_operation(self, command):
         """Handle arithmetic operations using Command Pattern with beautiful result display."""
-        c = self.COLORS
         if command not in self.OPERATION_COMMANDS:
             return False
         
@@ -260,130 +406,108 @@ class CalculatorREPL:
                 command,
                 a,
                 b,
-                cmd_info['description'] if cmd_info else '',
-                cmd_info['category'] if cmd_info else ''
+                cmd_info['description'],
+                cmd_info['category']
             )
             
             # Show processing message
-            print(f"\n{c['info']}⚙️  Calculating...{Style.RESET_ALL}")
+            print(f"\n{_C_INFO}⚙️  Calculating...{Style.RESET_ALL}")
             
-            result = operation_cmd.execute()
-            
-            # Normalize Decimal results
-            if isinstance(result, Decimal):
-                result = result.normalize()
+            # Operations always produce a Decimal, so normalize unconditionally
+            result = operation_cmd.execute().normalize()
             
             # Display beautiful result box
-            print(f"\n{c['success']}╔{'═' * 50}╗")
-            print(f"{c['success']}║{' ' * 50}║")
-            
             if command == 'percentage':
                 result_text = f"✨ RESULT: {result}%"
                 padding = 48 - len(str(result))
-                print(f"{c['success']}║  {c['highlight']}{result_text}{' ' * (padding - 12)} {c['success']}║")
+                result_line = f"{_C_SUCCESS}║  {_C_HIGHLIGHT}{result_text}{' ' * (padding - 12)} {_C_SUCCESS}║"
             else:
                 result_str = str(result)
                 padding = 38 - len(result_str)
-                print(f"{c['success']}║  {c['highlight']}✨ RESULT: {c['result']}{result_str}{' ' * padding} {c['success']}║")
+                result_line = f"{_C_SUCCESS}║  {_C_HIGHLIGHT}✨ RESULT: {_C_RESULT}{result_str}{' ' * padding} {_C_SUCCESS}║"
             
-            print(f"{c['success']}║{' ' * 50}║")
-            print(f"{c['success']}╚{'═' * 50}╝{Style.RESET_ALL}\n")
+            _emit(
+                f"\n{_C_SUCCESS}╔{_EQ50}╗",
+                f"{_C_SUCCESS}║{_SP50}║",
+                result_line,
+                f"{_C_SUCCESS}║{_SP50}║",
+                f"{_C_SUCCESS}╚{_EQ50}╝{Style.RESET_ALL}\n",
+            )
             
         except (ValidationError, OperationError) as e:
-            print(f"\n{c['error']}╔{'═' * 50}╗")
-            print(f"{c['error']}║{' ' * 50}║")
-            print(f"{c['error']}║  {Fore.WHITE}❌ ERROR{' ' * 40} ║")
-            error_msg = str(e)
-            # Wrap long error messages
-            if len(error_msg) > 44:
-                error_msg = error_msg[:44] + "..."
-            padding = 46 - len(error_msg)
-            print(f"{c['error']}║  {Fore.YELLOW}{error_msg}{' ' * padding} ║")
-            print(f"{c['error']}║{' ' * 50}║")
-            print(f"{c['error']}╚{'═' * 50}╝{Style.RESET_ALL}\n")
+            _emit_error(_TITLE_ERROR, str(e))
         except Exception as e:
-            print(f"\n{c['error']}╔{'═' * 50}╗")
-            print(f"{c['error']}║{' ' * 50}║")
-            print(f"{c['error']}║  {Fore.WHITE}⚠️  UNEXPECTED ERROR{' ' * 29} ║")
-            error_msg = str(e)
-            if len(error_msg) > 44:
-                error_msg = error_msg[:44] + "..."
-            padding = 46 - len(error_msg)
-            print(f"{c['error']}║  {Fore.YELLOW}{error_msg}{' ' * padding} ║")
-            print(f"{c['error']}║{' ' * 50}║")
-            print(f"{c['error']}╚{'═' * 50}╝{Style.RESET_ALL}\n")
+            _emit_error(_TITLE_UNEXPECTED_ERROR, str(e))
         
         return True
     
     def process_command(self, command):
         """Process a single command with colorful feedback."""
-        c = self.COLORS
-        command = command.lower().strip()
+        command = command.strip()
         
+        # Blank input returns before any lowercased copy is made
         if not command:
             return
+        command = command.lower()
         
-        if command == 'help':
-            self.display_help()
-            return
-        
-        if command == 'exit':
-            self.handle_exit()
-            return
-        
-        # Try each command handler
-        if self.handle_history_command(command):
-            return
-        
-        if self.handle_file_command(command):
-            return
-        
-        if self.handle_operation(command):
+        # Single hash lookup routes every known command to its handler
+        handler = _DISPATCH.get(command)
+        if handler:
+            handler(self)
             return
         
         # Unknown command with colorful error
-        print(f"\n{c['error']}╔{'═' * 50}╗")
-        print(f"{c['error']}║{' ' * 50}║")
-        print(f"{c['error']}║  {Fore.WHITE}❓ UNKNOWN COMMAND{' ' * 31} ║")
         cmd_display = command if len(command) <= 40 else command[:40] + "..."
-        padding = 46 - len(cmd_display)
-        print(f"{c['error']}║  {Fore.YELLOW}'{cmd_display}'{' ' * padding} ║")
-        print(f"{c['error']}║{' ' * 50}║")
-        print(f"{c['error']}║  {Fore.CYAN}💡 Type 'help' for available commands{' ' * 10} ║")
-        print(f"{c['error']}║{' ' * 50}║")
-        print(f"{c['error']}╚{'═' * 50}╝{Style.RESET_ALL}\n")
+        _emit_error(_TITLE_UNKNOWN_COMMAND, f"'{cmd_display}'", _HELP_HINT_LINE, _ERROR_BLANK)
     
     def run(self):
         """Main REPL loop with colorful interface."""
-        c = self.COLORS
         self.display_welcome()
         
         while self.running:
             try:
-                command = input(f"{c['prompt']}➤ {c['highlight']}Enter command: {c['normal']}")
+                command = input(f"{_C_PROMPT}➤ {_C_HIGHLIGHT}Enter command: {_C_NORMAL}")
                 self.process_command(command)
                 
             except KeyboardInterrupt:
-                print(f"\n\n{c['warning']}╔{'═' * 48}╗")
-                print(f"{c['warning']}║{Fore.YELLOW}{'🚫 Operation Cancelled'.center(48)}{c['warning']}║")
-                print(f"{c['warning']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+                _emit(
+                    f"\n\n{_C_WARNING}╔{_EQ48}╗",
+                    f"{_C_WARNING}║{Fore.YELLOW}{_LBL_CANCELLED}{_C_WARNING}║",
+                    f"{_C_WARNING}╚{_EQ48}╝{Style.RESET_ALL}\n",
+                )
                 continue
             
             except EOFError:
-                print(f"\n\n{c['info']}╔{'═' * 48}╗")
-                print(f"{c['info']}║{Fore.YELLOW}{'🔚 Input Terminated'.center(48)}{c['info']}║")
-                print(f"{c['info']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+                _emit(
+                    f"\n\n{_C_INFO}╔{_EQ48}╗",
+                    f"{_C_INFO}║{Fore.YELLOW}{_LBL_INPUT_TERMINATED}{_C_INFO}║",
+                    f"{_C_INFO}╚{_EQ48}╝{Style.RESET_ALL}\n",
+                )
                 self.handle_exit()
                 break
             
             except Exception as e:
-                print(f"\n{c['error']}╔{'═' * 48}╗")
-                print(f"{c['error']}║{Fore.WHITE}{'⚠️  ERROR'.center(48)}{c['error']}║")
-                print(f"{c['error']}║{Fore.YELLOW}{str(e).center(48)}{c['error']}║")
-                print(f"{c['error']}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+                # Unlike the operation error boxes, the full message is shown
+                _emit(
+                    f"\n{_C_ERROR}╔{_EQ48}╗",
+                    f"{_C_ERROR}║{Fore.WHITE}{_LBL_LOOP_ERROR}{_C_ERROR}║",
+                    f"{_C_ERROR}║{Fore.YELLOW}{str(e).center(48)}{_C_ERROR}║",
+                    f"{_C_ERROR}╚{_EQ48}╝{Style.RESET_ALL}\n",
+                )
                 continue
 
 
+# Command name -> handler invoked with the REPL instance. Handlers are
+# resolved by name at call time, so the table is shared by all instances.
+_DISPATCH: Final[Dict[str, Callable[[CalculatorREPL], object]]] = {
+    'help': methodcaller('display_help'),
+    'exit': methodcaller('handle_exit'),
+    **{cmd: methodcaller('handle_history_command', cmd) for cmd in _HISTORY_COMMANDS},
+    **{cmd: methodcaller('handle_file_command', cmd) for cmd in _FILE_CMDS},
+    **{cmd: methodcaller('handle_operation', cmd) for cmd in CalculatorREPL.OPERATION_COMMANDS},
+}
+
+
 def calculator_repl():
     """
     Command-line interface for the calculator.
@@ -404,9 +528,11 @@ def calculator_repl():
         repl = CalculatorREPL()
         repl.run()
     except Exception as e:
-        print(f"\n{Fore.RED}{Style.BRIGHT}╔{'═' * 48}╗")
-        print(f"{Fore.RED}{Style.BRIGHT}║{Fore.WHITE}{'💥 FATAL ERROR'.center(48)}{Fore.RED}║")
-        print(f"{Fore.RED}{Style.BRIGHT}║{Fore.YELLOW}{str(e).center(48)}{Fore.RED}║")
-        print(f"{Fore.RED}{Style.BRIGHT}╚{'═' * 48}╝{Style.RESET_ALL}\n")
+        _emit(
+            f"\n{Fore.RED}{Style.BRIGHT}╔{_EQ48}╗",
+            f"{Fore.RED}{Style.BRIGHT}║{Fore.WHITE}{_LBL_FATAL_ERROR}{Fore.RED}║",
+            f"{Fore.RED}{Style.BRIGHT}║{Fore.YELLOW}{str(e).center(48)}{Fore.RED}║",
+            f"{Fore.RED}{Style.BRIGHT}╚{_EQ48}╝{Style.RESET_ALL}\n",
+        )
         logging.error(f"Fatal error in calculator REPL: {e}")
         raise
\ No newline at end of file
@@ -0,0 +1,41 @@
+########################
+# Terminal Colors      #
+########################
+
+import sys
+from typing import Any, Tuple
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style namespaces that renders every code as ''."""
+    
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+def init_colors(stream: Any) -> Tuple[Any, Any]:
+    """
+    Initialize colorama only when output goes to an interactive terminal.
+    
+    Piped and captured output (scripts, tests, CI) skips colorama's stdout
+    wrapping entirely and renders every color code as an empty string.
+    
+    Args:
+        stream: Output stream to inspect, normally sys.stdout.
+    
+    Returns:
+        Tuple[Any, Any]: The (Fore, Style) namespaces to format output with.
+    """
+    isatty = getattr(stream, 'isatty', None)
+    if isatty is not None and isatty():
+        import colorama
+        # Initialize colorama for cross-platform color support
+        colorama.init(autoreset=True)
+        return colorama.Fore, colorama.Style
+    no_color = _NoColor()
+    return no_color, no_color
+
+
+# Shared by every module that formats terminal output, so the REPL and the
+# help menu always agree on whether color codes are emitted
+Fore, Style = init_colors(sys.stdout)
@@ -4,9 +4,54 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from operator import methodcaller
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 from app.calculator import Calculator
-from app.operations import OperationFactory
+from app.operations import Operation, OperationFactory
+
+# Metadata returned for unregistered commands; read-only because it is shared
+_EMPTY_INFO: Mapping[str, str] = MappingProxyType({'description': '', 'category': ''})
+
+
+@lru_cache(maxsize=None)
+def _shared_instance(operation_class: type) -> Operation:
+    """
+    Return the one shared instance of an operation class.
+    
+    Operations hold no state between ``execute`` calls, so one instance per
+    class can be reused by every command. Any operation registered with the
+    factory must stay stateless for this cache to be safe.
+    
+    Args:
+        operation_class: Operation subclass to instantiate.
+    
+    Returns:
+        Operation: Cached operation instance.
+    """
+    return operation_class()
+
+
+def _get_operation(operation_type: str) -> Operation:
+    """
+    Return a shared operation instance for the given type.
+    
+    The name is resolved through the factory on every call and the cache is
+    keyed on the resulting class, so re-registering a name takes effect
+    immediately.
+    
+    Args:
+        operation_type: Type of operation (e.g., 'add', 'subtract').
+    
+    Returns:
+        Operation: Cached operation instance.
+    
+    Raises:
+        ValueError: If the operation type is not registered.
+    """
+    return _shared_instance(OperationFactory.get_operation_class(operation_type))
 
 
 class Command(ABC):
@@ -17,6 +62,9 @@ class Command(ABC):
     allowing for parameterization, queuing, and logging of operations.
     """
     
+    # ABC declares empty slots itself, so subclasses can stay dict-free
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self) -> Optional[Decimal]:
         """
@@ -56,6 +104,8 @@ class OperationCommand(Command):
     through the calculator instance.
     """
     
+    __slots__ = ('calculator', 'operation_type', 'a', 'b', 'description', 'category')
+    
     def __init__(self, calculator: Calculator, operation_type: str, 
                  a: str, b: str, description: str, category: str):
         """
@@ -83,7 +133,7 @@ class OperationCommand(Command):
         Returns:
             Optional[Decimal]: Result of the operation.
         """
-        operation = OperationFactory.create_operation(self.operation_type)
+        operation = _get_operation(self.operation_type)
         self.calculator.set_operation(operation)
         return self.calculator.perform_operation(self.a, self.b)
     
@@ -96,11 +146,27 @@ class OperationCommand(Command):
         return self.category
 
 
+def _clear_history(calculator: Calculator) -> None:
+    """Clear the calculator history, discarding any return value."""
+    calculator.clear_history()
+
+
 class HistoryCommand(Command):
     """
     Command for history management operations.
     """
     
+    __slots__ = ('calculator', 'action', 'description')
+    
+    # Action -> handler called with the calculator. Kept at class level so
+    # constructing a command does not bind a method per action.
+    _ACTIONS: Dict[str, Callable[[Calculator], Any]] = {
+        'show': methodcaller('show_history'),
+        'clear': _clear_history,
+        'undo': methodcaller('undo'),
+        'redo': methodcaller('redo')
+    }
+    
     def __init__(self, calculator: Calculator, action: str, description: str):
         """
         Initialize history command.
@@ -116,15 +182,8 @@ class HistoryCommand(Command):
     
     def execute(self) -> Optional[Decimal]:
         """Execute the history command."""
-        if self.action == 'show':
-            return self.calculator.show_history()
-        elif self.action == 'clear':
-            self.calculator.clear_history()
-        elif self.action == 'undo':
-            return self.calculator.undo()
-        elif self.action == 'redo':
-            return self.calculator.redo()
-        return None
+        handler = self._ACTIONS.get(self.action)
+        return handler(self.calculator) if handler else None
     
     def get_description(self) -> str:
         """Get command description."""
@@ -140,6 +199,14 @@ class FileCommand(Command):
     Command for file operations.
     """
     
+    __slots__ = ('calculator', 'action', 'description')
+    
+    # Action -> handler called with the calculator
+    _ACTIONS: Dict[str, Callable[[Calculator], Any]] = {
+        'save': methodcaller('save_history'),
+        'load': methodcaller('load_history')
+    }
+    
     def __init__(self, calculator: Calculator, action: str, description: str):
         """
         Initialize file command.
@@ -155,10 +222,9 @@ class FileCommand(Command):
     
     def execute(self) -> Optional[Decimal]:
         """Execute the file command."""
-        if self.action == 'save':
-            self.calculator.save_history()
-        elif self.action == 'load':
-            self.calculator.load_history()
+        handler = self._ACTIONS.get(self.action)
+        if handler:
+            handler(self.calculator)
         return None
     
     def get_description(self) -> str:
@@ -178,11 +244,28 @@ class CommandRegistry:
     supporting the dynamic help menu generation.
     """
     
+    __slots__ = ('commands', '_version')
+    
     def __init__(self):
         """Initialize the command registry."""
         self.commands = {}
+        # Bumped on every change so renderers can tell when cached output is stale
+        self._version = 0
         self._register_default_commands()
     
+    @property
+    def version(self) -> int:
+        """
+        Change counter, bumped on every registration or removal.
+        
+        Renderers compare it with the value they last saw to tell whether
+        output built from this registry is stale.
+        
+        Returns:
+            int: Current version number.
+        """
+        return self._version
+    
     def _register_default_commands(self):
         """Register default command metadata."""
         # Basic Operations
@@ -222,10 +305,27 @@ class CommandRegistry:
             description: Command description.
             category: Command category.
         """
-        self.commands[name] = {
-            'description': description,
-            'category': category
+        # Interned strings let lookups with interned keys match by identity
+        self.commands[sys.intern(name)] = {
+            'description': sys.intern(description),
+            'category': sys.intern(category)
         }
+        self._version += 1
+    
+    def unregister_command_metadata(self, name: str) -> bool:
+        """
+        Remove command metadata.
+        
+        Args:
+            name: Command name.
+            
+        Returns:
+            bool: True if the command was registered and has been removed.
+        """
+        if self.commands.pop(name, None) is None:
+            return False
+        self._version += 1
+        return True
     
     def get_commands_by_category(self) -> dict:
         """
@@ -245,7 +345,7 @@ class CommandRegistry:
             })
         return categorized
     
-    def get_command_info(self, name: str) -> dict:
+    def get_command_info(self, name: str) -> Mapping[str, str]:
         """
         Get information about a specific command.
         
@@ -253,6 +353,7 @@ class CommandRegistry:
             name: Command name.
             
         Returns:
-            dict: Command metadata or None if not found.
+            Mapping[str, str]: Command metadata, or read-only metadata with empty
+            description and category if the command is not registered.
         """
-        return self.commands.get(name)
\ No newline at end of file
+        return self.commands.get(name, _EMPTY_INFO)
\ No newline at end of file
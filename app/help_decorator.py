@@ -2,18 +2,35 @@
 # Help Menu Decorator  #
 ########################
 
-from abc import ABC, abstractmethod
-from colorama import Fore, Style
+import sys
+from typing import Optional, Protocol, Tuple, runtime_checkable
+from app.colors import Fore, Style
 
+# Separator line shared by every help section
+_SEP = "=" * 50
 
-class HelpDisplay(ABC):
+# Colorama codes bound once so formatting reads module globals only
+_FG_GREEN = Fore.GREEN
+_FG_YELLOW = Fore.YELLOW
+_FG_BLUE = Fore.BLUE
+_FG_MAGENTA = Fore.MAGENTA
+_FG_CYAN = Fore.CYAN
+_FG_WHITE = Fore.WHITE
+_BRIGHT = Style.BRIGHT
+_RESET = Style.RESET_ALL
+
+
+@runtime_checkable
+class HelpDisplay(Protocol):
     """
-    Abstract base class for help display.
+    Interface for help display.
     
     Part of the Decorator Pattern implementation for dynamic help menu generation.
+    Any object with a ``display() -> str`` method satisfies it structurally;
+    implementations do not inherit from it, so constructing them skips the
+    ABCMeta machinery.
     """
     
-    @abstractmethod
     def display(self) -> str:
         """
         Display help information.
@@ -21,16 +38,46 @@ class HelpDisplay(ABC):
         Returns:
             str: Formatted help text.
         """
-        pass # pragma: no cover
+        ...
 
 
-class BaseHelp(HelpDisplay):
+def _parts_of(help_display: HelpDisplay) -> Tuple[str, ...]:
+    """
+    Get the output lines of a help display without joining them.
+    
+    Displays from this module expose ``_display_parts`` so a decorator chain
+    is joined only once by the outermost caller. That shortcut is taken only
+    when the display's ``display`` is one of this module's own, which render
+    exactly their parts; any other HelpDisplay, including a subclass that
+    overrides ``display``, is treated as a single pre-joined part.
+    
+    Args:
+        help_display: HelpDisplay instance to read.
+    
+    Returns:
+        Tuple[str, ...]: Lines of the help output.
+    """
+    cls = type(help_display)
+    if getattr(cls, 'display', None) in _PARTS_DISPLAYS:
+        return cls._display_parts(help_display)
+    return (help_display.display(),)
+
+
+class BaseHelp:
     """
     Base help display implementation.
     
     Provides the basic structure for help information.
     """
     
+    # The banner never changes, so it is rendered once at import
+    _BANNER_PARTS = (
+        "\n" + _SEP,
+        f"{_FG_CYAN}{_BRIGHT}  AVAILABLE COMMANDS{_RESET}",
+        _SEP
+    )
+    _BANNER = "\n".join(_BANNER_PARTS)
+    
     def __init__(self, command_registry):
         """
         Initialize base help.
@@ -42,14 +89,14 @@ class BaseHelp(HelpDisplay):
     
     def display(self) -> str:
         """Display basic help structure."""
-        output = []
-        output.append("\n" + "=" * 50)
-        output.append(f"{Fore.CYAN}{Style.BRIGHT}  AVAILABLE COMMANDS{Style.RESET_ALL}")
-        output.append("=" * 50)
-        return "\n".join(output)
+        return self._BANNER
+    
+    def _display_parts(self) -> Tuple[str, ...]:
+        """Get the banner lines."""
+        return self._BANNER_PARTS
 
 
-class HelpDecorator(HelpDisplay):
+class HelpDecorator:
     """
     Abstract decorator for help display.
     
@@ -68,6 +115,54 @@ class HelpDecorator(HelpDisplay):
     def display(self) -> str:
         """Display decorated help."""
         return self._help_display.display()
+    
+    def _display_parts(self) -> Tuple[str, ...]:
+        """Get the decorated help lines."""
+        return _parts_of(self._help_display)
+
+
+# Category icons and colors
+_CATEGORY_STYLES = {
+    'Basic Operations': (_FG_GREEN, '📊'),
+    'Advanced Operations': (_FG_YELLOW, '🔢'),
+    'History Management': (_FG_BLUE, '📜'),
+    'File Operations': (_FG_MAGENTA, '💾'),
+    'Other': (_FG_CYAN, '🚪')
+}
+
+# Preferred category order, interned to match the registry's category keys
+_CATEGORY_ORDER = tuple(sys.intern(category) for category in (
+    'Basic Operations',
+    'Advanced Operations',
+    'History Management',
+    'File Operations',
+    'Other'
+))
+
+# Fully formatted section header per category
+_CATEGORY_HEADER = {
+    category: f"\n{color}{_BRIGHT}{icon} {category}:{_RESET}"
+    for category, (color, icon) in _CATEGORY_STYLES.items()
+}
+
+# Fixed pieces around each command line; names are padded to this width
+_CMD_PREFIX = "  " + _FG_WHITE
+_CMD_SUFFIX = _RESET + "- "
+_CMD_NAME_WIDTH = 13
+
+
+def _render_command_line(name: str, description: str) -> str:
+    """
+    Render one command's help line.
+    
+    Args:
+        name: Command name.
+        description: Command description.
+    
+    Returns:
+        str: Colored, padded help line for the command.
+    """
+    return _CMD_PREFIX + name.ljust(_CMD_NAME_WIDTH) + _CMD_SUFFIX + description
 
 
 class CategoryDecorator(HelpDecorator):
@@ -89,42 +184,31 @@ class CategoryDecorator(HelpDecorator):
         self.command_registry = command_registry
     
     def display(self) -> str:
-        """Display help with categorized commands."""
-        output = [self._help_display.display()]
+        """
+        Display help with categorized commands.
+        
+        Returns:
+            str: Help text with a section per command category.
+        """
+        return "\n".join(self._display_parts())
+    
+    def _display_parts(self) -> Tuple[str, ...]:
+        """Get the help lines with categorized commands."""
+        output = list(_parts_of(self._help_display))
         
         # Get commands organized by category
         categorized = self.command_registry.get_commands_by_category()
         
-        # Define category icons and colors
-        category_styles = {
-            'Basic Operations': (Fore.GREEN, '📊'),
-            'Advanced Operations': (Fore.YELLOW, '🔢'),
-            'History Management': (Fore.BLUE, '📜'),
-            'File Operations': (Fore.MAGENTA, '💾'),
-            'Other': (Fore.CYAN, '🚪')
-        }
-        
-        # Define preferred category order
-        category_order = [
-            'Basic Operations',
-            'Advanced Operations', 
-            'History Management',
-            'File Operations',
-            'Other'
-        ]
-        
         # Display commands by category in preferred order
-        for category in category_order:
+        for category in _CATEGORY_ORDER:
             if category in categorized:
-                color, icon = category_styles.get(category, (Fore.WHITE, '•'))
-                output.append(f"\n{color}{Style.BRIGHT}{icon} {category}:{Style.RESET_ALL}")
+                output.append(_CATEGORY_HEADER[category])
                 
-                commands = categorized[category]
-                for cmd in commands:
-                    output.append(f"  {Fore.WHITE}{cmd['name']:<13}{Style.RESET_ALL}- {cmd['description']}")
+                for cmd in categorized[category]:
+                    output.append(_render_command_line(cmd['name'], cmd['description']))
         
-        output.append("=" * 50 + "\n")
-        return "\n".join(output)
+        output.append(_SEP + "\n")
+        return tuple(output)
 
 
 class ColorDecorator(HelpDecorator):
@@ -142,6 +226,17 @@ class ColorDecorator(HelpDecorator):
         return base_output
 
 
+# Static usage example lines appended by ExamplesDecorator
+_EXAMPLES_PARTS = (
+    f"\n{_FG_CYAN}{_BRIGHT}💡 USAGE EXAMPLES:{_RESET}",
+    f"  {_FG_GREEN}add{_RESET}          : Add 10 and 5",
+    f"  {_FG_GREEN}power{_RESET}        : Calculate 2^8",
+    f"  {_FG_GREEN}percentage{_RESET}   : Find what % 25 is of 200",
+    f"  {_FG_GREEN}history{_RESET}      : View all calculations",
+    _SEP + "\n"
+)
+
+
 class ExamplesDecorator(HelpDecorator):
     """
     Decorator that adds usage examples to help display.
@@ -149,16 +244,58 @@ class ExamplesDecorator(HelpDecorator):
     
     def display(self) -> str:
         """Display help with usage examples."""
-        output = [self._help_display.display()]
-        
-        output.append(f"\n{Fore.CYAN}{Style.BRIGHT}💡 USAGE EXAMPLES:{Style.RESET_ALL}")
-        output.append(f"  {Fore.GREEN}add{Style.RESET_ALL}          : Add 10 and 5")
-        output.append(f"  {Fore.GREEN}power{Style.RESET_ALL}        : Calculate 2^8")
-        output.append(f"  {Fore.GREEN}percentage{Style.RESET_ALL}   : Find what % 25 is of 200")
-        output.append(f"  {Fore.GREEN}history{Style.RESET_ALL}      : View all calculations")
-        output.append("=" * 50 + "\n")
+        return "\n".join(self._display_parts())
+    
+    def _display_parts(self) -> Tuple[str, ...]:
+        """Get the wrapped help lines followed by the example lines."""
+        return _parts_of(self._help_display) + _EXAMPLES_PARTS
+
+
+class _CachedHelp:
+    """
+    Help display that reuses its rendered text until the registry changes.
+    
+    Returned by HelpMenuBuilder.build so repeated ``help`` commands cost a
+    single version comparison. This is the only cache in the help pipeline;
+    the decorators it wraps render from the registry on every call. A
+    registry without a ``version`` is re-rendered every time.
+    """
+    
+    def __init__(self, help_display: HelpDisplay, command_registry):
+        """
+        Initialize cached help.
         
-        return "\n".join(output)
+        Args:
+            help_display: Fully decorated help display to render.
+            command_registry: Registry whose version guards the cached text.
+        """
+        self._help_display = help_display
+        self.command_registry = command_registry
+        self._text: Optional[str] = None
+        self._version = -1
+    
+    def display(self) -> str:
+        """Display the help text, re-rendering it only after registry changes."""
+        version = getattr(self.command_registry, 'version', None)
+        if self._text is None or version is None or version != self._version:
+            self._text = self._help_display.display()
+            self._version = version
+        return self._text
+    
+    def _display_parts(self) -> Tuple[str, ...]:
+        """Get the cached help text as a single part."""
+        return (self.display(),)
+
+
+# display() implementations that return exactly "\n".join(self._display_parts())
+_PARTS_DISPLAYS = frozenset({
+    BaseHelp.display,
+    HelpDecorator.display,
+    CategoryDecorator.display,
+    ColorDecorator.display,
+    ExamplesDecorator.display,
+    _CachedHelp.display,
+})
 
 
 class HelpMenuBuilder:
@@ -197,7 +334,10 @@ class HelpMenuBuilder:
         """
         Build and return the decorated help display.
         
+        The result caches its rendered text and re-renders only when the
+        command registry version changes.
+        
         Returns:
             HelpDisplay: Fully decorated help display instance.
         """
-        return self.help_display
\ No newline at end of file
+        return _CachedHelp(self.help_display, self.command_registry)
\ No newline at end of file
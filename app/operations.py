@@ -4,6 +4,7 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
+import math
 from typing import Dict
 from app.exceptions import ValidationError
 
@@ -246,6 +247,11 @@ class Root(Operation):
             Decimal: Result of the root calculation.
         """
         self.validate_operands(a, b)
+        # Perfect integer squares are answered exactly, without the float round trip
+        if b == 2 and a.is_finite() and a == a.to_integral_value():
+            root = math.isqrt(int(a))
+            if root * root == a:
+                return Decimal(root)
         return Decimal(pow(float(a), 1 / float(b)))
 
 
@@ -440,6 +446,28 @@ class OperationFactory:
             raise TypeError("Operation class must inherit from Operation")
         cls._operations[name.lower()] = operation_class
 
+    @classmethod
+    def get_operation_class(cls, operation_type: str) -> type:
+        """
+        Look up the class registered for an operation type.
+
+        Args:
+            operation_type (str): The type of operation (e.g., 'add').
+
+        Returns:
+            type: The Operation subclass currently registered under that name.
+
+        Raises:
+            ValueError: If the operation type is unknown.
+        """
+        # Callers usually pass the registered lowercase name, so try it as-is
+        # before allocating a lowercased copy
+        operation_class = (cls._operations.get(operation_type)
+                           or cls._operations.get(operation_type.lower()))
+        if not operation_class:
+            raise ValueError(f"Unknown operation: {operation_type}")
+        return operation_class
+
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
         """
@@ -457,7 +485,4 @@ class OperationFactory:
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
\ No newline at end of file
+        return cls.get_operation_class(operation_type)()
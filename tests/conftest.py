@@ -0,0 +1,108 @@
+import copy
+import logging
+from types import SimpleNamespace
+import pytest
+from app.calculator_repl import CalculatorREPL
+from app.operations import OperationFactory
+
+
+@pytest.fixture(autouse=True)
+def _fast_logging(request, monkeypatch):
+    """Make logging.basicConfig a no-op so Calculator() does not reopen a log file per test.
+
+    Tests marked ``real_logging`` keep the real implementation.
+    """
+    if request.node.get_closest_marker("real_logging") is None:
+        monkeypatch.setattr(logging, 'basicConfig', lambda *args, **kwargs: None)
+
+
+# Operations are stateless strategies, so one instance serves the whole session
+
+@pytest.fixture(scope="session")
+def add_op():
+    return OperationFactory.create_operation('add')
+
+
+@pytest.fixture(scope="session")
+def multiply_op():
+    return OperationFactory.create_operation('multiply')
+
+
+# A REPL's registry and help menu are immutable in practice, so each module
+# shares one REPL built against a private temp directory. Tests that mutate
+# calculator state take ``repl``, a copy with its own Calculator; the copy
+# shares command_registry and help_display, so tests that change those use
+# fresh_repl.
+
+@pytest.fixture(scope="module")
+def readonly_repl(tmp_path_factory):
+    """One REPL, backed by a private temp directory, shared by tests that never mutate it."""
+    base = tmp_path_factory.mktemp("readonly_repl")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('CALCULATOR_LOG_DIR', str(base / "logs"))
+        mp.setenv('CALCULATOR_LOG_FILE', str(base / "logs/calculator.log"))
+        mp.setenv('CALCULATOR_HISTORY_DIR', str(base / "history"))
+        mp.setenv('CALCULATOR_HISTORY_FILE', str(base / "history/calculator_history.csv"))
+        yield CalculatorREPL()
+
+
+@pytest.fixture
+def repl(readonly_repl):
+    """A copy of the module's REPL with a fresh Calculator under the same temp directory."""
+    r = copy.copy(readonly_repl)
+    r._new_calculator()
+    return r
+
+
+@pytest.fixture
+def fresh_repl():
+    """A fully constructed REPL with its own registry and help menu."""
+    return CalculatorREPL()
+
+
+@pytest.fixture
+def io_capture(monkeypatch):
+    """Swap builtins.input/print for plain recorders.
+
+    ``set_inputs`` queues the values input() returns; exception instances in
+    the queue are raised instead. Printed text lands in ``out`` (one entry per
+    print call, joined by ``text()``) and input prompts in ``prompts``.
+    ``text()`` rejoins only when ``out`` has grown since the last call.
+    """
+    out = []
+    prompts = []
+    inputs = iter(())
+    joined = [0, ""]
+
+    def set_inputs(values):
+        nonlocal inputs
+        inputs = iter(values)
+
+    def fake_input(prompt=''):
+        prompts.append(prompt)
+        value = next(inputs)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    def fake_print(*args, **kwargs):
+        out.append(str(args[0]) if len(args) == 1 else " ".join(map(str, args)))
+
+    def text():
+        if joined[0] != len(out):
+            joined[:] = len(out), "\n".join(out)
+        return joined[1]
+
+    monkeypatch.setattr('builtins.input', fake_input)
+    monkeypatch.setattr('builtins.print', fake_print)
+    return SimpleNamespace(out=out, prompts=prompts, set_inputs=set_inputs, text=text)
+
+
+@pytest.fixture
+def run_session(repl, io_capture):
+    """Run a full REPL session on the test's ``repl`` and return its printed text."""
+    def _run(inputs):
+        io_capture.set_inputs(inputs)
+        repl.run()
+        return io_capture.text()
+    return _run
@@ -1,35 +1,33 @@
 import datetime
+import logging
 from pathlib import Path
 import pandas as pd
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, patch
 from decimal import Decimal
-from tempfile import TemporaryDirectory
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
-from app.operations import OperationFactory
+
+# Header-only history CSV, written directly instead of through pandas
+_EMPTY_HISTORY_CSV = b"operation,operand1,operand2,result,timestamp\n"
+
+
+def _use_paths_under(monkeypatch, base: Path):
+    """Point every CalculatorConfig path property at a directory under ``base``."""
+    monkeypatch.setattr(CalculatorConfig, 'log_dir', property(lambda self: base / "logs"))
+    monkeypatch.setattr(CalculatorConfig, 'log_file', property(lambda self: base / "logs/calculator.log"))
+    monkeypatch.setattr(CalculatorConfig, 'history_dir', property(lambda self: base / "history"))
+    monkeypatch.setattr(CalculatorConfig, 'history_file',
+                        property(lambda self: base / "history/calculator_history.csv"))
 
 
 # Fixture to initialize Calculator with a temporary directory for file paths
 @pytest.fixture
-def calculator():
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            yield Calculator(config=config)
+def calculator(tmp_path, monkeypatch):
+    _use_paths_under(monkeypatch, tmp_path)
+    return Calculator(config=CalculatorConfig(base_dir=tmp_path))
 
 
 # Test Calculator Initialization
@@ -41,59 +39,50 @@ def test_calculator_initialization(calculator):
     assert calculator.operation_strategy is None
 
 
+@pytest.fixture
+def mocked_config(tmp_path, monkeypatch):
+    """Config whose log and history paths all live under ``tmp_path``."""
+    _use_paths_under(monkeypatch, tmp_path)
+    return CalculatorConfig(base_dir=tmp_path)
+
+
+@pytest.fixture
+def log_calls(monkeypatch):
+    """Record messages passed to logging.info/warning/error, keyed by level."""
+    calls = {'info': [], 'warning': [], 'error': []}
+    for level, messages in calls.items():
+        monkeypatch.setattr(logging, level, lambda msg, *args, _messages=messages, **kwargs: _messages.append(msg))
+    return calls
+
+
 # Test Logging Setup
 
-@patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        calculator = Calculator(CalculatorConfig())
-        logging_info_mock.assert_any_call("Calculator initialized with configuration")
+def test_logging_setup(mocked_config, log_calls):
+    Calculator(config=mocked_config)
+    assert "Calculator initialized with configuration" in log_calls['info']
 
 
-# NEW TEST: Cover lines 77-79 (logging setup error handling)
-def test_logging_setup_failure():
+def test_logging_setup_failure(mocked_config):
     """Test that logging setup handles errors properly."""
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-        
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch('logging.basicConfig', side_effect=Exception("Logging setup failed")):
-            
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            
-            with pytest.raises(Exception, match="Logging setup failed"):
-                Calculator(config=config)
-
-
-# NEW TEST: Cover lines 103-106 (load history warning on failure)
-def test_calculator_init_with_load_history_failure():
+    with patch('logging.basicConfig', side_effect=Exception("Logging setup failed")):
+        with pytest.raises(Exception, match="Logging setup failed"):
+            Calculator(config=mocked_config)
+
+
+def test_calculator_init_with_load_history_failure(mocked_config, log_calls):
     """Test calculator initialization when load_history fails (covers warning log)."""
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-        
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file, \
-             patch('app.calculator.Calculator.load_history', side_effect=Exception("Cannot load history")), \
-             patch('logging.warning') as mock_warning:
-            
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            calc = Calculator(config=config)
-            mock_warning.assert_called()
-            assert calc.history == []
+    with patch('app.calculator.Calculator.load_history', side_effect=Exception("Cannot load history")):
+        calc = Calculator(config=mocked_config)
+    
+    assert log_calls['warning']
+    assert calc.history == []
+
+
+@pytest.mark.real_logging
+def test_logging_setup_writes_log_file(mocked_config):
+    """Test that logging setup creates the configured log file."""
+    Calculator(config=mocked_config)
+    assert mocked_config.log_file.exists()
 
 
 # Test Adding and Removing Observers
@@ -112,12 +101,12 @@ def test_remove_observer(calculator):
 
 
 # NEW TEST: Test observer notification
-def test_notify_observers(calculator):
+def test_notify_observers(calculator, add_op):
     """Test that observers are notified of new calculations."""
     mock_observer = Mock()
     calculator.add_observer(mock_observer)
     
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     
     mock_observer.update.assert_called_once()
@@ -127,23 +116,21 @@ def test_notify_observers(calculator):
 
 # Test Setting Operations
 
-def test_set_operation(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
-    assert calculator.operation_strategy == operation
+def test_set_operation(calculator, add_op):
+    calculator.set_operation(add_op)
+    assert calculator.operation_strategy == add_op
 
 
 # Test Performing Operations
 
-def test_perform_operation_addition(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_perform_operation_addition(calculator, add_op):
+    calculator.set_operation(add_op)
     result = calculator.perform_operation(2, 3)
     assert result == Decimal('5')
 
 
-def test_perform_operation_validation_error(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+def test_perform_operation_validation_error(calculator, add_op):
+    calculator.set_operation(add_op)
     with pytest.raises(ValidationError):
         calculator.perform_operation('invalid', 3)
 
@@ -154,61 +141,51 @@ def test_perform_operation_operation_error(calculator):
 
 
 # NEW TEST: Cover line 219 (perform_operation ValidationError logging)
-def test_perform_operation_logs_validation_error(calculator):
+def test_perform_operation_logs_validation_error(calculator, add_op, log_calls):
     """Test that validation errors are logged properly."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
     
-    with patch('logging.error') as mock_error:
-        with pytest.raises(ValidationError):
-            calculator.perform_operation('invalid', 3)
-        
-        mock_error.assert_called()
-        assert any('Validation error' in str(call) for call in mock_error.call_args_list)
+    with pytest.raises(ValidationError):
+        calculator.perform_operation('invalid', 3)
+    
+    assert any('Validation error' in msg for msg in log_calls['error'])
 
 
 # Test Undo/Redo Functionality
 
-def test_undo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
-    calculator.perform_operation(2, 3)
-    calculator.undo()
-    assert calculator.history == []
-
-
-def test_redo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
-    calculator.perform_operation(2, 3)
-    calculator.undo()
-    calculator.redo()
-    assert len(calculator.history) == 1
-
-
-# NEW TEST: Cover line 371 (undo returns False when stack is empty)
-def test_undo_empty_stack(calculator):
-    """Test undo when there's nothing to undo."""
-    result = calculator.undo()
-    assert result == False
-    assert calculator.history == []
-
-
-# NEW TEST: Cover line 390 (redo returns False when stack is empty)
-def test_redo_empty_stack(calculator):
-    """Test redo when there's nothing to redo."""
-    result = calculator.redo()
-    assert result == False
-    assert calculator.history == []
+# Each step is (action, expected return, expected history length); "op" adds
+# 2 + 3 and its return value is not checked
+_UNDO_REDO_SEQUENCES = {
+    "undo": [("op", None, 1), ("undo", True, 0)],
+    "redo": [("op", None, 1), ("undo", True, 0), ("redo", True, 1)],
+    "undo_empty_stack": [("undo", False, 0)],
+    "redo_empty_stack": [("redo", False, 0)],
+    "new_operation_clears_redo_stack": [
+        ("op", None, 1), ("op", None, 2), ("undo", True, 1), ("op", None, 2), ("redo", False, 2)
+    ],
+}
+
+
+@pytest.mark.parametrize("sequence", _UNDO_REDO_SEQUENCES.values(), ids=_UNDO_REDO_SEQUENCES.keys())
+def test_undo_redo_states(calculator, add_op, sequence):
+    """Test undo/redo return values and history length after each step."""
+    calculator.set_operation(add_op)
+    for action, expected, history_len in sequence:
+        if action == "op":
+            calculator.perform_operation(2, 3)
+        else:
+            assert getattr(calculator, action)() is expected
+        assert len(calculator.history) == history_len
 
 
 # NEW TEST: Test full undo/redo workflow
-def test_undo_redo_workflow(calculator):
+def test_undo_redo_workflow(calculator, add_op, multiply_op):
     """Test complete undo/redo workflow."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     assert len(calculator.history) == 1
     
-    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    calculator.set_operation(multiply_op)
     calculator.perform_operation(4, 5)
     assert len(calculator.history) == 2
     
@@ -240,28 +217,11 @@ def test_undo_redo_workflow(calculator):
     assert result == False
 
 
-# NEW TEST: Test that performing new operation clears redo stack
-def test_new_operation_clears_redo_stack(calculator):
-    """Test that performing a new operation clears the redo stack."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
-    calculator.perform_operation(2, 3)
-    calculator.perform_operation(4, 5)
-    
-    # Undo one operation
-    calculator.undo()
-    assert len(calculator.redo_stack) > 0
-    
-    # Perform new operation (should clear redo stack)
-    calculator.perform_operation(6, 7)
-    assert len(calculator.redo_stack) == 0
-
-
 # Test History Management
 
 @patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_save_history(mock_to_csv, calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.save_history()
     mock_to_csv.assert_called_once()
@@ -276,24 +236,21 @@ def test_save_empty_history(calculator):
     
     assert calculator.config.history_file.exists()
     
-    df = pd.read_csv(calculator.config.history_file)
-    assert df.empty
-    assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+    content = calculator.config.history_file.read_text().strip().splitlines()
+    assert content == ['operation,operand1,operand2,result,timestamp']
 
 
 # NEW TEST: Cover lines 268-275 (save_history failure)
-def test_save_history_failure(calculator):
+def test_save_history_failure(calculator, add_op, log_calls):
     """Test save_history error handling."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     
-    with patch('pandas.DataFrame.to_csv', side_effect=Exception("Write error")), \
-         patch('logging.error') as mock_error:
-        
+    with patch('pandas.DataFrame.to_csv', side_effect=Exception("Write error")):
         with pytest.raises(OperationError, match="Failed to save history"):
             calculator.save_history()
-        
-        mock_error.assert_called()
+    
+    assert log_calls['error']
 
 
 @patch('app.calculator.pd.read_csv')
@@ -319,55 +276,50 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
 
 
 # NEW TEST: Cover line 305 (load_history when file doesn't exist)
-def test_load_history_no_file(calculator):
+def test_load_history_no_file(calculator, log_calls):
     """Test load_history when no history file exists."""
     if calculator.config.history_file.exists():
         calculator.config.history_file.unlink()
     
-    with patch('logging.info') as mock_info:
-        calculator.load_history()
-        
-        assert any('No history file found' in str(call) for call in mock_info.call_args_list)
-        assert calculator.history == []
+    calculator.load_history()
+    
+    assert any('No history file found' in msg for msg in log_calls['info'])
+    assert calculator.history == []
 
 
 # NEW TEST: Cover lines 309-312 (load_history with empty file)
-def test_load_history_empty_file(calculator):
+def test_load_history_empty_file(calculator, log_calls):
     """Test load_history with an empty CSV file."""
     calculator.config.history_dir.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                ).to_csv(calculator.config.history_file, index=False)
+    calculator.config.history_file.write_bytes(_EMPTY_HISTORY_CSV)
     
-    with patch('logging.info') as mock_info:
-        calculator.load_history()
-        
-        assert any('empty history' in str(call).lower() for call in mock_info.call_args_list)
-        assert calculator.history == []
+    calculator.load_history()
+    
+    assert any('empty history' in msg.lower() for msg in log_calls['info'])
+    assert calculator.history == []
 
 
 # NEW TEST: Cover lines 324-333 (load_history failure)
-def test_load_history_failure(calculator):
+def test_load_history_failure(calculator, log_calls):
     """Test load_history error handling when called explicitly."""
     # Create a history file first
     calculator.config.history_dir.mkdir(parents=True, exist_ok=True)
     calculator.config.history_file.touch()
     
     # Now test load_history failure when called explicitly
-    with patch('pandas.read_csv', side_effect=Exception("Read error")), \
-         patch('logging.error') as mock_error:
-        
+    with patch('pandas.read_csv', side_effect=Exception("Read error")):
         with pytest.raises(OperationError, match="Failed to load history"):
             calculator.load_history()
-        
-        mock_error.assert_called()
+    
+    assert log_calls['error']
 
 
 # NEW TEST: Cover line 344 (get_history_dataframe)
-def test_get_history_dataframe(calculator):
+def test_get_history_dataframe(calculator, add_op, multiply_op):
     """Test getting history as a DataFrame."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
-    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    calculator.set_operation(multiply_op)
     calculator.perform_operation(4, 5)
     
     df = calculator.get_history_dataframe()
@@ -381,9 +333,8 @@ def test_get_history_dataframe(calculator):
 
 # Test Clearing History
 
-def test_clear_history(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_clear_history(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
     assert calculator.history == []
@@ -392,16 +343,19 @@ def test_clear_history(calculator):
 
 
 # NEW TEST: Test history size limit
-def test_history_size_limit(calculator):
+def test_history_size_limit(calculator, add_op):
     """Test that history respects max size limit."""
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(add_op)
+    calculator.observers.clear()
     
     max_size = calculator.config.max_history_size
     
-    for i in range(max_size + 5):
+    # One entry over the cap is enough to trigger trimming
+    for i in range(max_size + 1):
         calculator.perform_operation(i, 1)
     
-    assert len(calculator.history) <= max_size
+    assert len(calculator.history) == max_size
+    assert calculator.history[0].operand1 == Decimal('1')
 
 
 # NEW TEST: Test calculator with default config (no config provided)
@@ -1,26 +1,84 @@
+from contextlib import contextmanager
+import re
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
 from decimal import Decimal
-from app.calculator_repl import calculator_repl, CalculatorREPL
-from app.exceptions import OperationError, ValidationError
-from colorama import Fore, Style
+import app.calculator_repl as repl_module
+from app.calculator_repl import (
+    calculator_repl, CalculatorREPL, _emit, _emit_error, _is_cancel,
+)
+from app.exceptions import ValidationError
 
 
 # ========================================
 # Helper Functions
 # ========================================
 
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
 def strip_ansi(text):
     """Remove ANSI color codes from text for easier assertion."""
-    import re
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _ANSI_ESCAPE.sub('', text)
+
+
+# Alternative spellings accepted for common banners
+RESULT_TOKENS = ('RESULT', 'Result')
+HELP_TOKENS = ('AVAILABLE COMMANDS', 'COMMANDS')
+GOODBYE_TOKENS = ('Thank you', 'Goodbye', 'Come back')
+ERROR_TOKENS = ('ERROR', 'Error', 'error')
+UNKNOWN_TOKENS = ('UNKNOWN COMMAND', 'Unknown command')
+
+
+def any_in(tokens, text):
+    """Return True if any of ``tokens`` occurs in ``text``."""
+    return any(token in text for token in tokens)
+
+
+class _FakeAddOp:
+    """Minimal addition strategy; cheaper to build and call than a configured Mock."""
+    __slots__ = ()
+    
+    def execute(self, a, b):
+        return a + b
+    
+    def __str__(self):
+        return "Addition"
+
+
+_FAKE_ADD = _FakeAddOp()
+
+# Fixed results for the perform_operation stand-ins, parsed once
+_DEC_5 = Decimal('5.0000')
+_DEC_BIG = Decimal('1.23E+50')
+
+
+@contextmanager
+def _swap(obj, attr, fn):
+    """Temporarily shadow the method ``attr`` on instance ``obj`` with ``fn``."""
+    setattr(obj, attr, fn)
+    try:
+        yield
+    finally:
+        delattr(obj, attr)
+
+
+def _noop():
+    """Stand-in for calculator methods whose side effects tests skip."""
+
+
+def _raising(message, exc_type=Exception):
+    """Build a stand-in that raises ``exc_type(message)`` whatever it is called with."""
+    def _raise(*args, **kwargs):
+        raise exc_type(message)
+    return _raise
 
 
-def get_print_output(mock_print):
-    """Extract all printed text from mock_print calls."""
-    calls_text = ' '.join(str(call) for call in mock_print.call_args_list)
-    return strip_ansi(calls_text)
+@pytest.fixture(autouse=True)
+def _stub_history_io(monkeypatch):
+    """Keep REPL tests off the real history file; tests that need a failure swap in their own stand-in."""
+    monkeypatch.setattr('app.calculator.Calculator.save_history', lambda self: None)
+    monkeypatch.setattr('app.calculator.Calculator.load_history', lambda self: None)
 
 
 # ========================================
@@ -41,52 +99,58 @@ def test_repl_initialization():
 # Display Methods Tests
 # ========================================
 
-@patch('builtins.print')
-def test_display_welcome(mock_print):
+def test_display_welcome(readonly_repl, io_capture):
     """Test welcome message display."""
-    repl = CalculatorREPL()
+    repl = readonly_repl
     repl.display_welcome()
     
-    assert mock_print.called
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
+    assert output
     assert 'CALCULATOR REPL' in output or 'Calculator' in output
 
 
-@patch('builtins.print')
-def test_display_help(mock_print):
+def test_display_help(readonly_repl, io_capture):
     """Test help message display."""
-    repl = CalculatorREPL()
+    repl = readonly_repl
     repl.display_help()
     
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(HELP_TOKENS, output)
     assert 'add' in output.lower()
 
 
-@patch('builtins.print')
-def test_display_history_empty(mock_print):
+def test_display_help_reflects_registry_changes(fresh_repl, io_capture):
+    """Test that help is reused between calls and refreshed after registration."""
+    repl = fresh_repl
+    repl.display_help()
+    repl.display_help()
+    first, second = io_capture.out
+    assert first is second
+    
+    repl.command_registry.register_command_metadata('sqrt', 'Square root', 'Advanced Operations')
+    repl.display_help()
+    
+    assert 'sqrt' in strip_ansi(io_capture.out[-1])
+
+
+def test_display_history_empty(readonly_repl, io_capture):
     """Test displaying empty history."""
-    repl = CalculatorREPL()
+    repl = readonly_repl
     repl.display_history()
     
-    # Just verify the method was called and printed something
-    assert mock_print.called
-    # Get the output to check it contains something about history
-    output = get_print_output(mock_print)
     # Be very flexible - just check that some output was produced
+    output = strip_ansi(io_capture.text())
     assert len(output) > 0
 
 
-@patch('builtins.print')
-def test_display_history_with_entries(mock_print):
+def test_display_history_with_entries(io_capture, repl):
     """Test displaying history with entries."""
-    repl = CalculatorREPL()
-    repl.calc.set_operation(Mock(execute=lambda a, b: a + b, __str__=lambda s: "Addition"))
+    repl.calc.set_operation(_FAKE_ADD)
     repl.calc.perform_operation(2, 3)
     
     repl.display_history()
     
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'CALCULATION HISTORY' in output or 'HISTORY' in output
 
 
@@ -94,30 +158,23 @@ def test_display_history_with_entries(mock_print):
 # Exit Handler Tests
 # ========================================
 
-@patch('builtins.print')
-def test_handle_exit_success(mock_print):
+def test_handle_exit_success(io_capture, repl):
     """Test successful exit with history save."""
-    repl = CalculatorREPL()
+    repl.handle_exit()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.handle_exit()
-        
-        assert repl.running == False
-        output = get_print_output(mock_print)
-        assert 'saved' in output.lower() or 'History saved' in output
-        assert 'Thank you' in output or 'Goodbye' in output or 'Come back' in output
+    assert repl.running == False
+    output = strip_ansi(io_capture.text())
+    assert 'saved' in output.lower() or 'History saved' in output
+    assert any_in(GOODBYE_TOKENS, output)
 
 
-@patch('builtins.print')
-def test_handle_exit_save_failure(mock_print):
+def test_handle_exit_save_failure(io_capture, repl):
     """Test exit when history save fails."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'save_history', side_effect=Exception("Save failed")):
+    with _swap(repl.calc, 'save_history', _raising("Save failed")):
         repl.handle_exit()
         
         assert repl.running == False
-        output = get_print_output(mock_print)
+        output = strip_ansi(io_capture.text())
         assert 'Could not save history' in output or 'Warning' in output
 
 
@@ -125,151 +182,62 @@ def test_handle_exit_save_failure(mock_print):
 # History Command Tests
 # ========================================
 
-@patch('builtins.print')
-def test_handle_history_command_history(mock_print):
-    """Test 'history' command."""
-    repl = CalculatorREPL()
-    result = repl.handle_history_command('history')
-    
-    assert result == True
-    assert mock_print.called
-
-
-@patch('builtins.print')
-def test_handle_history_command_clear(mock_print):
-    """Test 'clear' command."""
-    repl = CalculatorREPL()
-    repl.calc.set_operation(Mock(execute=lambda a, b: a + b, __str__=lambda s: "Addition"))
-    repl.calc.perform_operation(2, 3)
-    
-    result = repl.handle_history_command('clear')
-    
-    assert result == True
-    assert len(repl.calc.history) == 0
-    output = get_print_output(mock_print)
-    assert 'cleared' in output.lower()
-
-
-@patch('builtins.print')
-def test_handle_history_command_undo_success(mock_print):
-    """Test 'undo' command with successful undo."""
-    repl = CalculatorREPL()
-    repl.calc.set_operation(Mock(execute=lambda a, b: a + b, __str__=lambda s: "Addition"))
+def _add_one(repl):
+    """Record a single 2 + 3 calculation."""
+    repl.calc.set_operation(_FAKE_ADD)
     repl.calc.perform_operation(2, 3)
-    
-    result = repl.handle_history_command('undo')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'undone' in output.lower()
-
 
-@patch('builtins.print')
-def test_handle_history_command_undo_nothing(mock_print):
-    """Test 'undo' command when nothing to undo."""
-    repl = CalculatorREPL()
-    
-    result = repl.handle_history_command('undo')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'Nothing to undo' in output or 'Nothing' in output
 
-
-@patch('builtins.print')
-def test_handle_history_command_redo_success(mock_print):
-    """Test 'redo' command with successful redo."""
-    repl = CalculatorREPL()
-    repl.calc.set_operation(Mock(execute=lambda a, b: a + b, __str__=lambda s: "Addition"))
-    repl.calc.perform_operation(2, 3)
+def _add_then_undo(repl):
+    """Record a calculation and undo it, leaving one entry to redo."""
+    _add_one(repl)
     repl.calc.undo()
-    
-    result = repl.handle_history_command('redo')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'redone' in output.lower()
 
 
-@patch('builtins.print')
-def test_handle_history_command_redo_nothing(mock_print):
-    """Test 'redo' command when nothing to redo."""
-    repl = CalculatorREPL()
+@pytest.mark.parametrize("cmd, setup, expect_substr, expected_return", [
+    ('history', None, 'history', True),
+    ('clear', _add_one, 'cleared', True),
+    ('undo', _add_one, 'undone', True),
+    ('undo', None, 'nothing to undo', True),
+    ('redo', _add_then_undo, 'redone', True),
+    ('redo', None, 'nothing to redo', True),
+    ('unknown', None, '', False),
+], ids=['history', 'clear', 'undo_success', 'undo_nothing', 'redo_success', 'redo_nothing', 'unknown'])
+def test_handle_history_command(cmd, setup, expect_substr, expected_return, io_capture, repl):
+    """Test each history command's return value and confirmation message."""
+    if setup:
+        setup(repl)
     
-    result = repl.handle_history_command('redo')
+    result = repl.handle_history_command(cmd)
     
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'Nothing to redo' in output or 'Nothing' in output
-
-
-def test_handle_history_command_unknown():
-    """Test handle_history_command with unknown command."""
-    repl = CalculatorREPL()
-    result = repl.handle_history_command('unknown')
-    
-    assert result == False
+    assert result == expected_return
+    assert expect_substr in strip_ansi(io_capture.text()).lower()
+    if cmd == 'clear':
+        assert len(repl.calc.history) == 0
 
 
 # ========================================
 # File Command Tests
 # ========================================
 
-@patch('builtins.print')
-def test_handle_file_command_save_success(mock_print):
-    """Test 'save' command with successful save."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'save_history'):
-        result = repl.handle_file_command('save')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'saved successfully' in output.lower()
-
-
-@patch('builtins.print')
-def test_handle_file_command_save_failure(mock_print):
-    """Test 'save' command with save failure."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'save_history', side_effect=Exception("Save failed")):
-        result = repl.handle_file_command('save')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'Error saving history' in output or 'Error' in output
-
-
-@patch('builtins.print')
-def test_handle_file_command_load_success(mock_print):
-    """Test 'load' command with successful load."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'load_history'):
-        result = repl.handle_file_command('load')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'loaded successfully' in output.lower()
-
-
-@patch('builtins.print')
-def test_handle_file_command_load_failure(mock_print):
-    """Test 'load' command with load failure."""
-    repl = CalculatorREPL()
+@pytest.mark.parametrize("cmd, replacement, expect_substr", [
+    ('save', _noop, 'saved successfully'),
+    ('save', _raising("Save failed"), 'error saving history'),
+    ('load', _noop, 'loaded successfully'),
+    ('load', _raising("Load failed"), 'error loading history'),
+], ids=['save_success', 'save_failure', 'load_success', 'load_failure'])
+def test_handle_file_command(cmd, replacement, expect_substr, io_capture, repl):
+    """Test save/load commands report success or failure and keep the REPL running."""
+    with _swap(repl.calc, f'{cmd}_history', replacement):
+        result = repl.handle_file_command(cmd)
     
-    with patch.object(repl.calc, 'load_history', side_effect=Exception("Load failed")):
-        result = repl.handle_file_command('load')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'Error loading history' in output or 'Error' in output
+    assert result == True
+    assert expect_substr in strip_ansi(io_capture.text()).lower()
 
 
-def test_handle_file_command_unknown():
+def test_handle_file_command_unknown(readonly_repl):
     """Test handle_file_command with unknown command."""
-    repl = CalculatorREPL()
+    repl = readonly_repl
     result = repl.handle_file_command('unknown')
     
     assert result == False
@@ -279,59 +247,84 @@ def test_handle_file_command_unknown():
 # Operation Input Tests
 # ========================================
 
-@patch('builtins.input', side_effect=['5', '3'])
-@patch('builtins.print')
-def test_get_operation_inputs_valid(mock_print, mock_input):
+def test_get_operation_inputs_valid(readonly_repl, io_capture):
     """Test getting valid operation inputs."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['5', '3'])
+    repl = readonly_repl
     a, b = repl.get_operation_inputs('add')
     
     assert a == '5'
     assert b == '3'
 
 
-@patch('builtins.input', side_effect=['cancel'])
-@patch('builtins.print')
-def test_get_operation_inputs_cancel_first(mock_print, mock_input):
+def test_get_operation_inputs_cancel_first(readonly_repl, io_capture):
     """Test canceling at first input."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['cancel'])
+    repl = readonly_repl
     a, b = repl.get_operation_inputs('add')
     
     assert a is None
     assert b is None
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'cancelled' in output.lower()
 
 
-@patch('builtins.input', side_effect=['5', 'cancel'])
-@patch('builtins.print')
-def test_get_operation_inputs_cancel_second(mock_print, mock_input):
+def test_get_operation_inputs_cancel_second(readonly_repl, io_capture):
     """Test canceling at second input."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['5', 'cancel'])
+    repl = readonly_repl
     a, b = repl.get_operation_inputs('add')
     
     assert a is None
     assert b is None
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'cancelled' in output.lower()
 
 
-@patch('builtins.input', side_effect=['10', '5'])
-@patch('builtins.print')
-def test_get_operation_inputs_percentage(mock_print, mock_input):
+def test_get_operation_inputs_percentage(readonly_repl, io_capture):
     """Test getting inputs for percentage operation with custom prompts."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['10', '5'])
+    repl = readonly_repl
     a, b = repl.get_operation_inputs('percentage')
     
     assert a == '10'
     assert b == '5'
 
 
-@patch('builtins.input', side_effect=['16', '2'])
-@patch('builtins.print')
-def test_get_operation_inputs_root(mock_print, mock_input):
+def test_get_operation_inputs_prompt_text(readonly_repl, io_capture):
+    """Test that prebuilt prompts are passed to input, with a default fallback."""
+    io_capture.set_inputs(['10', '5'])
+    repl = readonly_repl
+    repl.get_operation_inputs('percentage')
+    assert [strip_ansi(p) for p in io_capture.prompts] == [
+        '💯 Value: ', '📊 Total (base): '
+    ]
+
+    io_capture.set_inputs(['1', '2'])
+    io_capture.prompts.clear()
+    repl.get_operation_inputs('unlisted')
+    assert [strip_ansi(p) for p in io_capture.prompts] == [
+        '🔢 First number: ', '🔢 Second number: '
+    ]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('cancel', True),
+    ('CANCEL', True),
+    ('Cancel', True),
+    ('cancelled', False),
+    ('12.5', False),
+    ('', False),
+])
+def test_is_cancel(text, expected):
+    """Test detection of the cancel keyword in operand input."""
+    assert _is_cancel(text) is expected
+
+
+def test_get_operation_inputs_root(readonly_repl, io_capture):
     """Test getting inputs for root operation with custom prompts."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['16', '2'])
+    repl = readonly_repl
     a, b = repl.get_operation_inputs('root')
     
     assert a == '16'
@@ -342,471 +335,304 @@ def test_get_operation_inputs_root(mock_print, mock_input):
 # Operation Handler Tests
 # ========================================
 
-@patch('builtins.input', side_effect=['2', '3'])
-@patch('builtins.print')
-def test_handle_operation_add(mock_print, mock_input):
-    """Test handling addition operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('add')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '5' in output
-
-
-@patch('builtins.input', side_effect=['10', '2'])
-@patch('builtins.print')
-def test_handle_operation_subtract(mock_print, mock_input):
-    """Test handling subtraction operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('subtract')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '8' in output
-
-
-@patch('builtins.input', side_effect=['4', '5'])
-@patch('builtins.print')
-def test_handle_operation_multiply(mock_print, mock_input):
-    """Test handling multiplication operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('multiply')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '20' in output or '2E+1' in output or '2.0E+1' in output
-
-
-@patch('builtins.input', side_effect=['10', '2'])
-@patch('builtins.print')
-def test_handle_operation_divide(mock_print, mock_input):
-    """Test handling division operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('divide')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '5' in output
-
-
-@patch('builtins.input', side_effect=['2', '3'])
-@patch('builtins.print')
-def test_handle_operation_power(mock_print, mock_input):
-    """Test handling power operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('power')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '8' in output
-
-
-@patch('builtins.input', side_effect=['16', '2'])
-@patch('builtins.print')
-def test_handle_operation_root(mock_print, mock_input):
-    """Test handling root operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('root')
+# (operation, operand inputs, acceptable result substrings; empty means any result)
+_OPERATION_CASES = [
+    ('add', ['2', '3'], ('5',)),
+    ('subtract', ['10', '2'], ('8',)),
+    ('multiply', ['4', '5'], ('20', '2E+1', '2.0E+1')),
+    ('divide', ['10', '2'], ('5',)),
+    ('power', ['2', '3'], ('8',)),
+    ('root', ['16', '2'], ('4',)),
+    ('modulus', ['10', '3'], ()),
+    ('intdiv', ['10', '3'], ()),
+    ('percentage', ['50', '200'], ('%',)),
+    ('absdiff', ['10', '3'], ()),
+]
+
+
+@pytest.mark.parametrize("op, inputs, expected", _OPERATION_CASES, ids=[case[0] for case in _OPERATION_CASES])
+def test_handle_operation(op, inputs, expected, repl, io_capture):
+    """Test each operation command prints a result."""
+    io_capture.set_inputs(inputs)
+    result = repl.handle_operation(op)
     
     assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '4' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(RESULT_TOKENS, output)
+    if expected:
+        assert any(text in output for text in expected)
 
 
-@patch('builtins.input', side_effect=['cancel'])
-@patch('builtins.print')
-def test_handle_operation_cancelled(mock_print, mock_input):
+def test_handle_operation_cancelled(repl, io_capture):
     """Test handling operation when user cancels."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['cancel'])
     result = repl.handle_operation('add')
     
     assert result == True
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'cancelled' in output.lower()
 
 
-@patch('builtins.input', side_effect=['invalid', '3'])
-@patch('builtins.print')
-def test_handle_operation_validation_error(mock_print, mock_input):
+def test_handle_operation_validation_error(repl, io_capture):
     """Test handling operation with validation error."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['invalid', '3'])
     result = repl.handle_operation('add')
     
     assert result == True
-    output = get_print_output(mock_print)
-    assert 'ERROR' in output or 'Error' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(ERROR_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['10', '0'])
-@patch('builtins.print')
-def test_handle_operation_operation_error(mock_print, mock_input):
+def test_handle_operation_operation_error(repl, io_capture):
     """Test handling operation with operation error (division by zero)."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['10', '0'])
     result = repl.handle_operation('divide')
     
     assert result == True
-    output = get_print_output(mock_print)
-    assert 'ERROR' in output or 'Error' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(ERROR_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['2', '3'])
-@patch('builtins.print')
-def test_handle_operation_unexpected_error(mock_print, mock_input):
+def test_handle_operation_unexpected_error(repl, io_capture, monkeypatch):
     """Test handling operation with unexpected error."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['2', '3'])
+    monkeypatch.setattr('app.command_pattern._get_operation', _raising("Unexpected"))
+    result = repl.handle_operation('add')
     
-    with patch('app.operations.OperationFactory.create_operation', side_effect=Exception("Unexpected")):
-        result = repl.handle_operation('add')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'error' in output.lower()
+    assert result == True
+    output = strip_ansi(io_capture.text())
+    assert 'error' in output.lower()
 
 
-def test_handle_operation_unknown_command():
+def test_handle_operation_unknown_command(repl):
     """Test handle_operation with unknown command."""
-    repl = CalculatorREPL()
     result = repl.handle_operation('unknown')
     
     assert result == False
 
 
-@patch('builtins.input', side_effect=['10', '3'])
-@patch('builtins.print')
-def test_handle_operation_modulus(mock_print, mock_input):
-    """Test handling modulus operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('modulus')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
-@patch('builtins.input', side_effect=['10', '3'])
-@patch('builtins.print')
-def test_handle_operation_intdiv(mock_print, mock_input):
-    """Test handling integer division operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('intdiv')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
-@patch('builtins.input', side_effect=['50', '200'])
-@patch('builtins.print')
-def test_handle_operation_percentage(mock_print, mock_input):
-    """Test handling percentage operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('percentage')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '%' in output
-
-
-@patch('builtins.input', side_effect=['10', '3'])
-@patch('builtins.print')
-def test_handle_operation_absdiff(mock_print, mock_input):
-    """Test handling absolute difference operation."""
-    repl = CalculatorREPL()
-    result = repl.handle_operation('absdiff')
-    
-    assert result == True
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
 # ========================================
 # Process Command Tests
 # ========================================
 
-@patch('builtins.print')
-def test_process_command_empty(mock_print):
-    """Test processing empty command."""
-    repl = CalculatorREPL()
-    repl.process_command('')
+@pytest.mark.parametrize("commands", [[''], ['   '], ['', '', '  ']],
+                         ids=['empty', 'whitespace', 'repeated'])
+def test_process_command_blank_is_noop(io_capture, repl, commands):
+    """Test that empty and whitespace-only commands print nothing and keep the REPL running."""
+    for command in commands:
+        repl.process_command(command)
     
-    mock_print.assert_not_called()
+    assert io_capture.out == []
+    assert repl.running == True
 
 
-@patch('builtins.print')
-def test_process_command_help(mock_print):
-    """Test processing help command."""
-    repl = CalculatorREPL()
-    repl.process_command('help')
+@pytest.mark.parametrize("cmd", ["help", "HELP", "  help  ", "HeLp"])
+def test_process_command_help_variants(io_capture, repl, cmd):
+    """Test help is recognised regardless of case and surrounding whitespace."""
+    repl.process_command(cmd)
     
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(HELP_TOKENS, output)
 
 
-@patch('builtins.print')
-def test_process_command_exit(mock_print):
+def test_process_command_exit(repl):
     """Test processing exit command."""
-    repl = CalculatorREPL()
+    repl.process_command('exit')
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.process_command('exit')
-        
-        assert repl.running == False
+    assert repl.running == False
 
 
-@patch('builtins.print')
-def test_process_command_history(mock_print):
+def test_process_command_history(io_capture, repl):
     """Test processing history command."""
-    repl = CalculatorREPL()
     repl.process_command('history')
     
-    assert mock_print.called
+    assert io_capture.out
 
 
-@patch('builtins.print')
-def test_process_command_save(mock_print):
+def test_process_command_save(io_capture, repl):
     """Test processing save command."""
-    repl = CalculatorREPL()
+    repl.process_command('save')
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.process_command('save')
-        
-        output = get_print_output(mock_print)
-        assert 'saved' in output.lower()
+    output = strip_ansi(io_capture.text())
+    assert 'saved' in output.lower()
 
 
-@patch('builtins.input', side_effect=['2', '3'])
-@patch('builtins.print')
-def test_process_command_operation(mock_print, mock_input):
+def test_process_command_operation(repl, io_capture):
     """Test processing operation command."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['2', '3'])
     repl.process_command('add')
     
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(RESULT_TOKENS, output)
 
 
-@patch('builtins.print')
-def test_process_command_unknown(mock_print):
+def test_process_command_unknown(io_capture, repl):
     """Test processing unknown command."""
-    repl = CalculatorREPL()
     repl.process_command('invalid_command')
     
-    output = get_print_output(mock_print)
-    assert 'Unknown command' in output or 'UNKNOWN COMMAND' in output
-
-
-@patch('builtins.print')
-def test_process_command_case_insensitive(mock_print):
-    """Test that commands are case insensitive."""
-    repl = CalculatorREPL()
-    repl.process_command('HELP')
-    
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
-
-
-@patch('builtins.print')
-def test_process_command_with_whitespace(mock_print):
-    """Test that commands with whitespace are trimmed."""
-    repl = CalculatorREPL()
-    repl.process_command('  help  ')
-    
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(UNKNOWN_TOKENS, output)
 
 
 # ========================================
 # Main Run Loop Tests
 # ========================================
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_run_exit(mock_print, mock_input):
+def test_run_exit(repl, io_capture):
     """Test running REPL and exiting."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['exit'])
+    repl.run()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        output = get_print_output(mock_print)
-        assert 'CALCULATOR' in output or 'Calculator' in output
-        assert 'Thank you' in output or 'Goodbye' in output or 'Come back' in output
+    output = strip_ansi(io_capture.text())
+    assert 'CALCULATOR' in output or 'Calculator' in output
+    assert any_in(GOODBYE_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_run_help_then_exit(mock_print, mock_input):
+def test_run_help_then_exit(repl, io_capture):
     """Test running REPL with help command then exit."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['help', 'exit'])
+    repl.run()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        output = get_print_output(mock_print)
-        assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(HELP_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=[KeyboardInterrupt(), 'exit'])
-@patch('builtins.print')
-def test_run_keyboard_interrupt(mock_print, mock_input):
+def test_run_keyboard_interrupt(repl, io_capture):
     """Test handling KeyboardInterrupt (Ctrl+C)."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs([KeyboardInterrupt(), 'exit'])
+    repl.run()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        output = get_print_output(mock_print)
-        assert 'cancelled' in output.lower() or 'Cancelled' in output
+    output = strip_ansi(io_capture.text())
+    assert 'cancelled' in output.lower() or 'Cancelled' in output
 
 
-@patch('builtins.input', side_effect=EOFError())
-@patch('builtins.print')
-def test_run_eof_error(mock_print, mock_input):
+def test_run_eof_error(repl, io_capture):
     """Test handling EOFError (Ctrl+D)."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs([EOFError()])
+    repl.run()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        output = get_print_output(mock_print)
-        assert 'Terminated' in output or 'terminated' in output.lower()
+    output = strip_ansi(io_capture.text())
+    assert 'Terminated' in output or 'terminated' in output.lower()
 
 
-@patch('builtins.input', side_effect=[Exception("Test error"), 'exit'])
-@patch('builtins.print')
-def test_run_unexpected_error(mock_print, mock_input):
+def test_run_unexpected_error(repl, io_capture):
     """Test handling unexpected error in main loop."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs([Exception("Test error"), 'exit'])
+    repl.run()
     
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        output = get_print_output(mock_print)
-        assert 'Error' in output or 'error' in output or 'ERROR' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(ERROR_TOKENS, output)
+
+
+def test_run_unexpected_error_shows_full_message(repl, io_capture):
+    """Test that the main-loop error box does not truncate long messages."""
+    message = "loop failure " + "x" * 60
+    io_capture.set_inputs([Exception(message), 'exit'])
+    repl.run()
+    
+    assert message in strip_ansi(io_capture.text())
 
 
 # ========================================
 # calculator_repl() Function Tests
 # ========================================
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_calculator_repl_function_exit(mock_print, mock_input):
+def test_calculator_repl_function_exit(io_capture):
     """Test the calculator_repl() function with exit command."""
+    io_capture.set_inputs(['exit'])
     calculator_repl()
     
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'saved' in output.lower()
-    assert 'Thank you' in output or 'Goodbye' in output or 'Come back' in output
+    assert any_in(GOODBYE_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_function_help(mock_print, mock_input):
+def test_calculator_repl_function_help(io_capture):
     """Test the calculator_repl() function with help command."""
+    io_capture.set_inputs(['help', 'exit'])
     calculator_repl()
     
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(HELP_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_function_addition(mock_print, mock_input):
+def test_calculator_repl_function_addition(io_capture):
     """Test the calculator_repl() function with addition."""
+    io_capture.set_inputs(['add', '2', '3', 'exit'])
     calculator_repl()
     
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(RESULT_TOKENS, output)
     assert '5' in output
 
 
-@patch('app.calculator_repl.CalculatorREPL')
-@patch('builtins.print')
-@patch('logging.error')
-def test_calculator_repl_function_fatal_error(mock_log_error, mock_print, mock_repl_class):
+def _fatal_run():
+    raise Exception("Fatal error")
+
+
+_FATAL_REPL = SimpleNamespace(run=_fatal_run)
+
+
+def test_calculator_repl_function_fatal_error(monkeypatch, io_capture):
     """Test the calculator_repl() function with fatal error."""
-    mock_repl_instance = Mock()
-    mock_repl_instance.run.side_effect = Exception("Fatal error")
-    mock_repl_class.return_value = mock_repl_instance
+    logged = []
+    monkeypatch.setattr(repl_module, 'CalculatorREPL', lambda: _FATAL_REPL)
+    monkeypatch.setattr('logging.error', lambda *args, **kwargs: logged.append(args))
     
     with pytest.raises(Exception, match="Fatal error"):
         calculator_repl()
     
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'Fatal error' in output or 'FATAL ERROR' in output
-    mock_log_error.assert_called()
+    assert logged
 
 
 # ========================================
 # Integration Tests
 # ========================================
 
-@patch('builtins.input', side_effect=['add', '2', '3', 'history', 'clear', 'exit'])
-@patch('builtins.print')
-def test_full_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_full_workflow(run_session):
     """Test a full workflow: add, show history, clear, exit."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(run_session(['add', '2', '3', 'history', 'clear', 'exit']))
+    assert any_in(RESULT_TOKENS, output)
     assert '5' in output or 'HISTORY' in output
     assert 'cleared' in output.lower()
 
 
-@patch('builtins.input', side_effect=['add', '5', '3', 'undo', 'redo', 'exit'])
-@patch('builtins.print')
-def test_undo_redo_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_undo_redo_workflow(run_session):
     """Test undo/redo workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(run_session(['add', '5', '3', 'undo', 'redo', 'exit']))
+    assert any_in(RESULT_TOKENS, output)
     assert '8' in output or 'undone' in output.lower()
     assert 'undone' in output.lower()
     assert 'redone' in output.lower()
 
 
-@patch('builtins.input', side_effect=['multiply', '4', '5', 'save', 'exit'])
-@patch('builtins.print')
-def test_save_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_save_workflow(run_session):
     """Test workflow with save operation."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(run_session(['multiply', '4', '5', 'save', 'exit']))
+    assert any_in(RESULT_TOKENS, output)
     assert '20' in output or '2E+1' in output or '2.0E+1' in output
     assert 'saved' in output.lower()
 
 
-@patch('builtins.input', side_effect=['divide', '10', '2', 'subtract', '8', '3', 'history', 'exit'])
-@patch('builtins.print')
-def test_multiple_operations_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_multiple_operations_workflow(run_session):
     """Test workflow with multiple operations."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(run_session(['divide', '10', '2', 'subtract', '8', '3', 'history', 'exit']))
+    assert any_in(RESULT_TOKENS, output)
     assert '5' in output
     assert 'HISTORY' in output or 'history' in output.lower()
 
 
-@patch('builtins.input', side_effect=['power', '2', '8', 'root', '256', '2', 'exit'])
-@patch('builtins.print')
-def test_power_and_root_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_power_and_root_workflow(run_session):
     """Test workflow with power and root operations."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
+    output = strip_ansi(run_session(['power', '2', '8', 'root', '256', '2', 'exit']))
+    assert any_in(RESULT_TOKENS, output)
     assert '256' in output or '16' in output
 
 
@@ -814,98 +640,87 @@ def test_power_and_root_workflow(mock_print, mock_input):
 # Coverage Gap Tests
 # ========================================
 
-@patch('builtins.print')
-def test_display_history_multiple_entries(mock_print):
+def test_display_history_multiple_entries(io_capture, repl):
     """Test displaying history with multiple entries for alternating colors."""
-    repl = CalculatorREPL()
-    
     # Add multiple operations to test alternating row colors
-    mock_op = Mock(execute=lambda a, b: a + b, __str__=lambda s: "Addition")
-    repl.calc.set_operation(mock_op)
+    repl.calc.set_operation(_FAKE_ADD)
     for i in range(5):
         repl.calc.perform_operation(i, i+1)
     
     repl.display_history()
     
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert 'CALCULATION HISTORY' in output or 'HISTORY' in output
     assert 'Total calculations' in output or '5' in output
 
 
-@patch('builtins.input', side_effect=['very_long_command_name_that_exceeds_limit'])
-@patch('builtins.print')
-def test_process_command_long_unknown(mock_print, mock_input):
+def test_display_history_writes_frame_once(repl, io_capture):
+    """Test that the full history frame is written in a single print call."""
+    entries = [f"Addition({i}, 1) = {i + 1}" for i in range(3)]
+    
+    with _swap(repl.calc, 'show_history', lambda: entries):
+        repl.display_history()
+    
+    assert len(io_capture.out) == 1
+    frame = strip_ansi(io_capture.out[0])
+    assert '  1. Addition(0, 1) = 1' in frame
+    assert '  3. Addition(2, 1) = 3' in frame
+    assert frame.count('║') == 2 * (3 + len(entries))
+    assert 'Total calculations: 3' in frame
+
+
+def test_process_command_long_unknown(repl, io_capture):
     """Test processing very long unknown command (tests line 299 truncation)."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['very_long_command_name_that_exceeds_limit'])
     repl.process_command('a' * 50)
     
-    output = get_print_output(mock_print)
-    assert 'UNKNOWN COMMAND' in output or 'Unknown command' in output
+    output = strip_ansi(io_capture.text())
+    assert any_in(UNKNOWN_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['5', '3'])
-@patch('builtins.print')
-def test_handle_operation_long_error_message(mock_print, mock_input):
+def test_handle_operation_long_error_message(repl, io_capture, monkeypatch):
     """Test handling operation with very long error message (tests line 281-283)."""
-    repl = CalculatorREPL()
-    
+    io_capture.set_inputs(['5', '3'])
     long_error = "This is a very long error message " * 10
-    with patch('app.operations.OperationFactory.create_operation', 
-               side_effect=ValidationError(long_error)):
-        result = repl.handle_operation('add')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'ERROR' in output
+    monkeypatch.setattr('app.command_pattern._get_operation', _raising(long_error, ValidationError))
+    result = repl.handle_operation('add')
+    
+    assert result == True
+    output = strip_ansi(io_capture.text())
+    assert 'ERROR' in output
 
 
-@patch('builtins.input', side_effect=['5', '3'])
-@patch('builtins.print')
-def test_handle_operation_with_decimal_normalization(mock_print, mock_input):
+def test_handle_operation_with_decimal_normalization(repl, io_capture):
     """Test operation result normalization for Decimal (tests line 240-241)."""
-    repl = CalculatorREPL()
-    
-    # Mock an operation that returns a Decimal
-    with patch('app.calculator.Calculator.perform_operation', return_value=Decimal('5.0000')):
+    io_capture.set_inputs(['5', '3'])
+    # Stub an operation that returns a Decimal
+    with _swap(repl.calc, 'perform_operation', lambda a, b: _DEC_5):
         result = repl.handle_operation('add')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'RESULT' in output or 'Result' in output
+    
+    assert result == True
+    output = strip_ansi(io_capture.text())
+    assert any_in(RESULT_TOKENS, output)
 
 
-@patch('builtins.input', side_effect=['50', '200'])
-@patch('builtins.print')
-def test_handle_operation_percentage_display(mock_print, mock_input):
+def test_handle_operation_percentage_display(repl, io_capture):
     """Test percentage operation special display formatting."""
-    repl = CalculatorREPL()
+    io_capture.set_inputs(['50', '200'])
     result = repl.handle_operation('percentage')
     
     assert result == True
-    output = get_print_output(mock_print)
+    output = strip_ansi(io_capture.text())
     assert '%' in output
     assert 'RESULT' in output
 
 
-@patch('builtins.print')
-def test_colors_configuration(mock_print):
+def test_colors_configuration():
     """Test that color configuration is properly set."""
-    repl = CalculatorREPL()
-    
-    assert 'header' in repl.COLORS
-    assert 'success' in repl.COLORS
-    assert 'error' in repl.COLORS
-    assert 'warning' in repl.COLORS
-    assert 'info' in repl.COLORS
-    assert 'prompt' in repl.COLORS
-    assert 'result' in repl.COLORS
+    for key in ('header', 'success', 'error', 'warning', 'info', 'prompt', 'result'):
+        assert key in CalculatorREPL.COLORS
 
 
-@patch('builtins.print')
-def test_operation_commands_list(mock_print):
+def test_operation_commands_list():
     """Test that OPERATION_COMMANDS contains all expected operations."""
-    repl = CalculatorREPL()
-    
     expected_ops = [
         'add', 'subtract', 'multiply', 'divide', 
         'power', 'root', 'modulus', 'intdiv', 
@@ -913,37 +728,86 @@ def test_operation_commands_list(mock_print):
     ]
     
     for op in expected_ops:
-        assert op in repl.OPERATION_COMMANDS
-
-
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_load_command_workflow(mock_print, mock_input):
+        assert op in CalculatorREPL.OPERATION_COMMANDS
+
+
+def test_emit_writes_block_in_single_call(io_capture):
+    """Test that _emit joins all lines and prints them once."""
+    _emit("first", "second", "third")
+
+    assert io_capture.out == ["first\nsecond\nthird"]
+
+
+def test_emit_error_pads_and_truncates_message(io_capture):
+    """Test that error boxes pad short messages and cut long ones to the box width."""
+    _emit_error("TITLE", "short", "EXTRA")
+    _emit_error("TITLE", "x" * 60)
+
+    short_box, long_box = (strip_ansi(text).splitlines() for text in io_capture.out)
+    assert "║  " + "short".ljust(47) + " ║" in short_box
+    assert "EXTRA" in short_box
+    assert "║  " + "x" * 44 + "... ║" in long_box
+    # Message lines line up with the right border
+    border, message = short_box[1], short_box[4]
+    assert len(message) == len(border)
+
+
+def test_history_row_templates_match_dynamic_output():
+    """Test that the %-templates render the same rows as the former f-strings."""
+    module = repl_module
+    Fore, Style, header = module.Fore, module.Style, module._C_HEADER
+    entry = "Addition(2, 3) = 5"
+
+    assert module._ROW_ODD % (1, entry) == (
+        f"{header}║ {Fore.BLUE}{Style.BRIGHT}{1:3d}.{Style.RESET_ALL} "
+        f"{Fore.GREEN}{entry:<53}{header}║{Style.RESET_ALL}"
+    )
+    assert module._ROW_EVEN % (2, entry) == (
+        f"{header}║ {Fore.CYAN}{Style.BRIGHT}{2:3d}.{Style.RESET_ALL} "
+        f"{Fore.WHITE}{entry:<53}{header}║{Style.RESET_ALL}"
+    )
+
+
+def test_border_constants_match_dynamic_output():
+    """Test that precomputed border strings equal the previously built ones."""
+    module = repl_module
+    Fore, Style = module.Fore, module.Style
+    header = Fore.CYAN + Style.BRIGHT
+    highlight = Fore.MAGENTA + Style.BRIGHT
+
+    assert module._EQ48 == '═' * 48
+    assert module._EQ50 == '═' * 50
+    assert module._EQ60 == '═' * 60
+    assert module._SP50 == ' ' * 50
+    assert module._SP60 == ' ' * 60
+    assert module._HEADER_TOP_50 == f"{header}╔{'═' * 50}╗"
+    assert module._HEADER_BLANK_50 == f"{header}║{' ' * 50}║"
+    assert module._HEADER_BOTTOM_50 == f"{header}╚{'═' * 50}╝{Style.RESET_ALL}"
+    assert module._HEADER_TOP_48 == f"{header}╔{'═' * 48}╗"
+    assert module._HEADER_BOTTOM_48 == f"{header}╚{'═' * 48}╝{Style.RESET_ALL}"
+    assert module._HIGHLIGHT_TOP_48 == f"{highlight}╔{'═' * 48}╗"
+    assert module._HIGHLIGHT_BOTTOM_48 == f"{highlight}╚{'═' * 48}╝{Style.RESET_ALL}"
+
+
+@pytest.mark.slow
+def test_load_command_workflow(run_session):
     """Test load command in full workflow."""
-    with patch('app.calculator.Calculator.load_history'):
-        calculator_repl()
-        
-        output = get_print_output(mock_print)
-        assert 'loaded' in output.lower()
+    output = strip_ansi(run_session(['load', 'exit']))
+    
+    assert 'loaded' in output.lower()
 
 
-@patch('builtins.input', side_effect=['undo', 'exit'])
-@patch('builtins.print')
-def test_undo_empty_history_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_undo_empty_history_workflow(run_session):
     """Test undo with empty history in full workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
+    output = strip_ansi(run_session(['undo', 'exit']))
     assert 'Nothing to undo' in output or 'Nothing' in output
 
 
-@patch('builtins.input', side_effect=['redo', 'exit'])
-@patch('builtins.print')
-def test_redo_empty_workflow(mock_print, mock_input):
+@pytest.mark.slow
+def test_redo_empty_workflow(run_session):
     """Test redo with nothing to redo in full workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
+    output = strip_ansi(run_session(['redo', 'exit']))
     assert 'Nothing to redo' in output or 'Nothing' in output
 
 
@@ -951,125 +815,51 @@ def test_redo_empty_workflow(mock_print, mock_input):
 # Additional Edge Cases
 # ========================================
 
-@patch('builtins.input', side_effect=['5', '3'])
-@patch('builtins.print')
-def test_handle_operation_result_with_scientific_notation(mock_print, mock_input):
+def test_handle_operation_result_with_scientific_notation(repl, io_capture):
     """Test handling very large numbers that may use scientific notation."""
-    repl = CalculatorREPL()
-    
-    with patch('app.calculator.Calculator.perform_operation', 
-               return_value=Decimal('1.23E+50')):
+    io_capture.set_inputs(['5', '3'])
+    with _swap(repl.calc, 'perform_operation', lambda a, b: _DEC_BIG):
         result = repl.handle_operation('multiply')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'RESULT' in output
+    
+    assert result == True
+    output = strip_ansi(io_capture.text())
+    assert 'RESULT' in output
 
 
-@patch('builtins.print')
-def test_command_registry_initialization(mock_print):
+def test_command_registry_initialization(repl):
     """Test that command registry is properly initialized."""
-    repl = CalculatorREPL()
-    
     assert repl.command_registry is not None
     # Test that some commands are registered
-    assert repl.command_registry.get_command_info('add') is not None
+    assert repl.command_registry.get_command_info('add')['category'] == 'Basic Operations'
 
 
-@patch('builtins.print')
-def test_help_display_initialization(mock_print):
+def test_help_display_initialization(repl):
     """Test that help display is properly initialized with decorator pattern."""
-    repl = CalculatorREPL()
-    
     assert repl.help_display is not None
 
 
-@patch('builtins.input', side_effect=['', '', 'exit'])
-@patch('builtins.print')
-def test_multiple_empty_commands(mock_print, mock_input):
-    """Test handling multiple empty commands in sequence."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-        
-        # Empty commands should not produce any output
-        output = get_print_output(mock_print)
-        assert 'CALCULATOR' in output or 'Calculator' in output
-
-
-@patch('builtins.input', side_effect=['5', '3'])
-@patch('builtins.print')
-def test_handle_operation_exception_with_long_message(mock_print, mock_input):
+def test_handle_operation_exception_with_long_message(repl, io_capture):
     """Test unexpected exception with very long error message."""
-    repl = CalculatorREPL()
-    
+    io_capture.set_inputs(['5', '3'])
     very_long_error = "Unexpected error message that is extremely long " * 20
-    with patch('app.calculator.Calculator.perform_operation', 
-               side_effect=Exception(very_long_error)):
+    with _swap(repl.calc, 'perform_operation', _raising(very_long_error)):
         result = repl.handle_operation('add')
-        
-        assert result == True
-        output = get_print_output(mock_print)
-        assert 'UNEXPECTED ERROR' in output or 'error' in output.lower()
-
-
-@patch('builtins.input', side_effect=['  ', 'exit'])
-@patch('builtins.print')
-def test_whitespace_only_command(mock_print, mock_input):
-    """Test command with only whitespace."""
-    repl = CalculatorREPL()
-    
-    with patch.object(repl.calc, 'save_history'):
-        repl.run()
-
-
-@patch('builtins.input', side_effect=['HeLp', 'exit'])
-@patch('builtins.print')
-def test_mixed_case_command(mock_print, mock_input):
-    """Test command with mixed case."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'AVAILABLE COMMANDS' in output or 'COMMANDS' in output
-
-
-@patch('builtins.input', side_effect=['modulus', '10', '3', 'exit'])
-@patch('builtins.print')
-def test_modulus_operation_workflow(mock_print, mock_input):
-    """Test modulus operation in full workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
-@patch('builtins.input', side_effect=['intdiv', '10', '3', 'exit'])
-@patch('builtins.print')
-def test_intdiv_operation_workflow(mock_print, mock_input):
-    """Test integer division operation in full workflow."""
-    calculator_repl()
     
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
-@patch('builtins.input', side_effect=['absdiff', '10', '3', 'exit'])
-@patch('builtins.print')
-def test_absdiff_operation_workflow(mock_print, mock_input):
-    """Test absolute difference operation in full workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-
-
-@patch('builtins.input', side_effect=['percentage', '25', '100', 'exit'])
-@patch('builtins.print')
-def test_percentage_operation_workflow(mock_print, mock_input):
-    """Test percentage operation in full workflow."""
-    calculator_repl()
-    
-    output = get_print_output(mock_print)
-    assert 'RESULT' in output or 'Result' in output
-    assert '%' in output
\ No newline at end of file
+    assert result == True
+    output = strip_ansi(io_capture.text())
+    assert 'UNEXPECTED ERROR' in output or 'error' in output.lower()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("op, a, b, expect", [
+    ('modulus', '10', '3', None),
+    ('intdiv', '10', '3', None),
+    ('absdiff', '10', '3', None),
+    ('percentage', '25', '100', '%'),
+])
+def test_operation_workflow(run_session, op, a, b, expect):
+    """Test an operation end to end through the REPL loop."""
+    output = strip_ansi(run_session([op, a, b, 'exit']))
+    assert any_in(RESULT_TOKENS, output)
+    if expect:
+        assert expect in output
\ No newline at end of file
@@ -0,0 +1,38 @@
+from unittest.mock import Mock, patch
+from colorama import Fore, Style
+import app.calculator_repl as repl_module
+import app.colors as colors_module
+import app.help_decorator as help_module
+from app.colors import init_colors
+
+
+def test_init_colors_enables_colorama_for_tty():
+    """Test that an interactive stream gets real colorama codes."""
+    tty = Mock(isatty=Mock(return_value=True))
+
+    with patch('colorama.init') as mock_init:
+        fore, style = init_colors(tty)
+
+    mock_init.assert_called_once_with(autoreset=True)
+    assert fore.RED == Fore.RED
+    assert style.RESET_ALL == Style.RESET_ALL
+
+
+@patch('colorama.init')
+def test_init_colors_disabled_for_non_tty(mock_init):
+    """Test that piped output skips colorama and renders empty codes."""
+    piped = Mock(isatty=Mock(return_value=False))
+
+    fore, style = init_colors(piped)
+    no_stream_fore, _ = init_colors(object())
+
+    mock_init.assert_not_called()
+    assert fore.RED == ''
+    assert style.BRIGHT + style.RESET_ALL == ''
+    assert no_stream_fore.CYAN == ''
+
+
+def test_repl_and_help_menu_share_color_namespaces():
+    """Test that the REPL and help menu format with the same color switch."""
+    assert repl_module.Fore is help_module.Fore is colors_module.Fore
+    assert repl_module.Style is help_module.Style is colors_module.Style
@@ -2,9 +2,10 @@
 Tests for Command Pattern implementation.
 """
 
+import sys
+from collections import defaultdict
 import pytest
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock, patch
 from app.command_pattern import (
     Command,
     OperationCommand,
@@ -13,7 +14,56 @@ from app.command_pattern import (
     CommandRegistry
 )
 from app.calculator import Calculator
-from app.operations import Addition
+from app.operations import Operation, OperationFactory
+
+
+# Calculator results handed back by the stub, parsed once
+_D8 = Decimal('8')
+_D10 = Decimal('10')
+_D15 = Decimal('15')
+
+# Positional arguments after the calculator for a typical OperationCommand
+_OP_ARGS = ('add', '5', '3', 'Add two numbers', 'Basic Operations')
+
+
+class _CalcStub:
+    """Calculator stand-in that records every method call.
+
+    Any Calculator method name is a recorder that appends ``(args, kwargs)``
+    to ``calls[name]`` and returns ``returns.get(name)``; other names raise
+    AttributeError, as ``Mock(spec=Calculator)`` would.
+    """
+    
+    def __init__(self):
+        self.calls = defaultdict(list)
+        self.returns = {}
+    
+    def __getattr__(self, name):
+        if not hasattr(Calculator, name):
+            raise AttributeError(f"Calculator has no attribute {name!r}")
+        def record(*args, **kwargs):
+            self.calls[name].append((args, kwargs))
+            return self.returns.get(name)
+        return record
+
+
+@pytest.fixture(scope="module")
+def mock_calculator():
+    """One stub calculator shared by the module; _reset_calculator clears it per test."""
+    return _CalcStub()
+
+
+@pytest.fixture(autouse=True)
+def _reset_calculator(mock_calculator):
+    yield
+    mock_calculator.calls.clear()
+    mock_calculator.returns.clear()
+
+
+def test_calc_stub_rejects_unknown_calculator_methods(mock_calculator):
+    """Test that the stub only records methods Calculator actually has."""
+    with pytest.raises(AttributeError):
+        mock_calculator.perform_operatoin('1', '2')
 
 
 class TestCommand:
@@ -24,35 +74,16 @@ class TestCommand:
         with pytest.raises(TypeError):
             Command()
     
-    def test_command_requires_execute_method(self):
-        """Test that subclasses must implement execute method."""
-        class IncompleteCommand(Command):
-            def get_description(self):
-                return "test"
-            def get_category(self):
-                return "test"
-        
-        with pytest.raises(TypeError):
-            IncompleteCommand()
-    
-    def test_command_requires_get_description_method(self):
-        """Test that subclasses must implement get_description method."""
-        class IncompleteCommand(Command):
-            def execute(self):
-                pass
-            def get_category(self):
-                return "test"
-        
-        with pytest.raises(TypeError):
-            IncompleteCommand()
-    
-    def test_command_requires_get_category_method(self):
-        """Test that subclasses must implement get_category method."""
-        class IncompleteCommand(Command):
-            def execute(self):
-                pass
-            def get_description(self):
-                return "test"
+    @pytest.mark.parametrize("missing", ["execute", "get_description", "get_category"])
+    def test_command_requires_abstract_method(self, missing):
+        """Test that subclasses must implement every abstract method."""
+        methods = {
+            "execute": lambda self: None,
+            "get_description": lambda self: "test",
+            "get_category": lambda self: "test",
+        }
+        del methods[missing]
+        IncompleteCommand = type("IncompleteCommand", (Command,), methods)
         
         with pytest.raises(TypeError):
             IncompleteCommand()
@@ -61,21 +92,9 @@ class TestCommand:
 class TestOperationCommand:
     """Test OperationCommand class."""
     
-    @pytest.fixture
-    def mock_calculator(self):
-        """Create a mock calculator."""
-        return Mock(spec=Calculator)
-    
     def test_operation_command_initialization(self, mock_calculator):
         """Test OperationCommand initialization."""
-        cmd = OperationCommand(
-            mock_calculator,
-            'add',
-            '5',
-            '3',
-            'Add two numbers',
-            'Basic Operations'
-        )
+        cmd = OperationCommand(mock_calculator, *_OP_ARGS)
         
         assert cmd.calculator == mock_calculator
         assert cmd.operation_type == 'add'
@@ -86,46 +105,46 @@ class TestOperationCommand:
     
     def test_operation_command_execute(self, mock_calculator):
         """Test OperationCommand execute method."""
-        mock_calculator.perform_operation.return_value = Decimal('8')
+        mock_calculator.returns['perform_operation'] = _D8
         
-        cmd = OperationCommand(
-            mock_calculator,
-            'add',
-            '5',
-            '3',
-            'Add two numbers',
-            'Basic Operations'
-        )
+        result = OperationCommand(mock_calculator, *_OP_ARGS).execute()
+        
+        assert result == _D8
+        assert len(mock_calculator.calls['set_operation']) == 1
+        assert mock_calculator.calls['perform_operation'] == [(('5', '3'), {})]
+    
+    def test_operation_command_reuses_cached_operation(self, mock_calculator):
+        """Test that repeated executions share one operation instance."""
+        for _ in range(2):
+            OperationCommand(mock_calculator, *_OP_ARGS).execute()
+        
+        first, second = (args[0] for args, _ in mock_calculator.calls['set_operation'])
+        assert first is second
+    
+    def test_operation_command_follows_factory_reregistration(self, mock_calculator, monkeypatch):
+        """Test that re-registering an operation name replaces the cached instance."""
+        class Replacement(Operation):
+            def execute(self, a, b):
+                return a
         
-        result = cmd.execute()
+        OperationCommand(mock_calculator, *_OP_ARGS).execute()
+        monkeypatch.setattr(OperationFactory, '_operations', dict(OperationFactory._operations))
+        OperationFactory.register_operation('add', Replacement)
+        OperationCommand(mock_calculator, *_OP_ARGS).execute()
         
-        assert result == Decimal('8')
-        mock_calculator.set_operation.assert_called_once()
-        mock_calculator.perform_operation.assert_called_once_with('5', '3')
+        before, after = (args[0] for args, _ in mock_calculator.calls['set_operation'])
+        assert not isinstance(before, Replacement)
+        assert isinstance(after, Replacement)
     
     def test_operation_command_get_description(self, mock_calculator):
         """Test get_description method."""
-        cmd = OperationCommand(
-            mock_calculator,
-            'add',
-            '5',
-            '3',
-            'Add two numbers',
-            'Basic Operations'
-        )
+        cmd = OperationCommand(mock_calculator, *_OP_ARGS)
         
         assert cmd.get_description() == 'Add two numbers'
     
     def test_operation_command_get_category(self, mock_calculator):
         """Test get_category method."""
-        cmd = OperationCommand(
-            mock_calculator,
-            'multiply',
-            '4',
-            '7',
-            'Multiply two numbers',
-            'Basic Operations'
-        )
+        cmd = OperationCommand(mock_calculator, *_OP_ARGS)
         
         assert cmd.get_category() == 'Basic Operations'
 
@@ -133,11 +152,6 @@ class TestOperationCommand:
 class TestHistoryCommand:
     """Test HistoryCommand class."""
     
-    @pytest.fixture
-    def mock_calculator(self):
-        """Create a mock calculator."""
-        return Mock(spec=Calculator)
-    
     def test_history_command_initialization(self, mock_calculator):
         """Test HistoryCommand initialization."""
         cmd = HistoryCommand(
@@ -150,50 +164,26 @@ class TestHistoryCommand:
         assert cmd.action == 'show'
         assert cmd.description == 'Show calculation history'
     
-    def test_history_command_show_action(self, mock_calculator):
-        """Test history command with 'show' action."""
-        mock_calculator.show_history.return_value = None
-        
-        cmd = HistoryCommand(mock_calculator, 'show', 'Show history')
-        result = cmd.execute()
-        
-        mock_calculator.show_history.assert_called_once()
-        assert result is None
-    
-    def test_history_command_clear_action(self, mock_calculator):
-        """Test history command with 'clear' action."""
-        cmd = HistoryCommand(mock_calculator, 'clear', 'Clear history')
-        result = cmd.execute()
-        
-        mock_calculator.clear_history.assert_called_once()
-        assert result is None
-    
-    def test_history_command_undo_action(self, mock_calculator):
-        """Test history command with 'undo' action."""
-        mock_calculator.undo.return_value = Decimal('10')
-        
-        cmd = HistoryCommand(mock_calculator, 'undo', 'Undo last calculation')
-        result = cmd.execute()
-        
-        mock_calculator.undo.assert_called_once()
-        assert result == Decimal('10')
-    
-    def test_history_command_redo_action(self, mock_calculator):
-        """Test history command with 'redo' action."""
-        mock_calculator.redo.return_value = Decimal('15')
-        
-        cmd = HistoryCommand(mock_calculator, 'redo', 'Redo calculation')
-        result = cmd.execute()
-        
-        mock_calculator.redo.assert_called_once()
-        assert result == Decimal('15')
-    
-    def test_history_command_invalid_action(self, mock_calculator):
-        """Test history command with invalid action."""
-        cmd = HistoryCommand(mock_calculator, 'invalid', 'Invalid action')
-        result = cmd.execute()
-        
-        assert result is None
+    @pytest.mark.parametrize("action, method, ret, expected", [
+        ('show', 'show_history', ['Addition(2, 3) = 5'], ['Addition(2, 3) = 5']),
+        # clear discards whatever clear_history returns
+        ('clear', 'clear_history', 'cleared', None),
+        ('undo', 'undo', _D10, _D10),
+        ('redo', 'redo', _D15, _D15),
+        ('invalid', None, None, None),
+    ])
+    def test_history_command_action(self, mock_calculator, action, method, ret, expected):
+        """Test each history action calls its calculator method once and returns the expected result."""
+        if method:
+            mock_calculator.returns[method] = ret
+        
+        result = HistoryCommand(mock_calculator, action, 'History action').execute()
+        
+        assert result == expected
+        if method:
+            assert len(mock_calculator.calls[method]) == 1
+        else:
+            assert not mock_calculator.calls
     
     def test_history_command_get_description(self, mock_calculator):
         """Test get_description method."""
@@ -209,11 +199,6 @@ class TestHistoryCommand:
 class TestFileCommand:
     """Test FileCommand class."""
     
-    @pytest.fixture
-    def mock_calculator(self):
-        """Create a mock calculator."""
-        return Mock(spec=Calculator)
-    
     def test_file_command_initialization(self, mock_calculator):
         """Test FileCommand initialization."""
         cmd = FileCommand(
@@ -226,28 +211,20 @@ class TestFileCommand:
         assert cmd.action == 'save'
         assert cmd.description == 'Save history to file'
     
-    def test_file_command_save_action(self, mock_calculator):
-        """Test file command with 'save' action."""
-        cmd = FileCommand(mock_calculator, 'save', 'Save history')
-        result = cmd.execute()
-        
-        mock_calculator.save_history.assert_called_once()
-        assert result is None
-    
-    def test_file_command_load_action(self, mock_calculator):
-        """Test file command with 'load' action."""
-        cmd = FileCommand(mock_calculator, 'load', 'Load history')
-        result = cmd.execute()
-        
-        mock_calculator.load_history.assert_called_once()
-        assert result is None
-    
-    def test_file_command_invalid_action(self, mock_calculator):
-        """Test file command with invalid action."""
-        cmd = FileCommand(mock_calculator, 'invalid', 'Invalid action')
-        result = cmd.execute()
+    @pytest.mark.parametrize("action, method", [
+        ('save', 'save_history'),
+        ('load', 'load_history'),
+        ('invalid', None),
+    ])
+    def test_file_command_action(self, mock_calculator, action, method):
+        """Test each file action calls its calculator method once and returns None."""
+        result = FileCommand(mock_calculator, action, 'File action').execute()
         
         assert result is None
+        if method:
+            assert len(mock_calculator.calls[method]) == 1
+        else:
+            assert not mock_calculator.calls
     
     def test_file_command_get_description(self, mock_calculator):
         """Test get_description method."""
@@ -260,37 +237,61 @@ class TestFileCommand:
         assert cmd.get_category() == 'File Operations'
 
 
-class TestCommandRegistry:
-    """Test CommandRegistry class."""
+@pytest.mark.parametrize("make_instance", [
+    lambda calc: OperationCommand(calc, *_OP_ARGS),
+    lambda calc: HistoryCommand(calc, 'undo', 'Undo'),
+    lambda calc: FileCommand(calc, 'save', 'Save'),
+    lambda calc: CommandRegistry(),
+])
+def test_instances_use_slots(make_instance):
+    """Test that commands and the registry store fields in slots, not a __dict__."""
+    instance = make_instance(_CalcStub())
+    
+    assert not hasattr(instance, '__dict__')
+    with pytest.raises(AttributeError):
+        instance.unexpected = True
+
+
+# Registry tests are split by whether they mutate. Read-only tests share one
+# session-wide registry, so a stray register/unregister there would leak into
+# every later test; mutating tests get a private instance from fresh_registry.
+
+@pytest.fixture(scope="session")
+def shared_registry():
+    """One default registry shared by the tests that only read it."""
+    return CommandRegistry()
+
+
+@pytest.fixture(scope="session")
+def categorized(shared_registry):
+    """The shared registry's categorized view, built once."""
+    return shared_registry.get_commands_by_category()
+
+
+@pytest.fixture(scope="session")
+def category_names(categorized):
+    """Command names per category as frozensets, built once."""
+    return {cat: frozenset(cmd['name'] for cmd in cmds) for cat, cmds in categorized.items()}
+
+
+@pytest.fixture
+def fresh_registry():
+    """A private registry for tests that register or unregister commands."""
+    return CommandRegistry()
+
+
+class TestCommandRegistryReadOnly:
+    """Test CommandRegistry behaviour that leaves the registry unchanged."""
     
-    def test_command_registry_initialization(self):
+    def test_command_registry_initialization(self, shared_registry):
         """Test that registry initializes with default commands."""
-        registry = CommandRegistry()
-        
-        assert len(registry.commands) > 0
-        assert 'add' in registry.commands
-        assert 'subtract' in registry.commands
-        assert 'help' in registry.commands
-    
-    def test_register_command_metadata(self):
-        """Test registering new command metadata."""
-        registry = CommandRegistry()
-        
-        registry.register_command_metadata(
-            'custom',
-            'Custom command',
-            'Custom Category'
-        )
-        
-        assert 'custom' in registry.commands
-        assert registry.commands['custom']['description'] == 'Custom command'
-        assert registry.commands['custom']['category'] == 'Custom Category'
+        assert len(shared_registry.commands) > 0
+        assert 'add' in shared_registry.commands
+        assert 'subtract' in shared_registry.commands
+        assert 'help' in shared_registry.commands
     
-    def test_get_commands_by_category(self):
+    def test_get_commands_by_category(self, categorized, category_names):
         """Test retrieving commands organized by category."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
-        
         assert 'Basic Operations' in categorized
         assert 'Advanced Operations' in categorized
         assert 'History Management' in categorized
@@ -298,32 +299,34 @@ class TestCommandRegistry:
         assert 'Other' in categorized
         
         # Check that commands are in the right categories
-        basic_commands = [cmd['name'] for cmd in categorized['Basic Operations']]
-        assert 'add' in basic_commands
-        assert 'subtract' in basic_commands
-        assert 'multiply' in basic_commands
-        assert 'divide' in basic_commands
+        assert {'add', 'subtract', 'multiply', 'divide'} <= category_names['Basic Operations']
     
-    def test_get_command_info_existing_command(self):
+    def test_unregister_unknown_command(self, shared_registry, categorized):
+        """Test that removing an unknown command leaves the registry unchanged."""
+        version = shared_registry.version
+        
+        assert shared_registry.unregister_command_metadata('nonexistent') is False
+        assert shared_registry.version == version
+        assert shared_registry.get_commands_by_category() == categorized
+    
+    def test_get_command_info_existing_command(self, shared_registry):
         """Test getting info for existing command."""
-        registry = CommandRegistry()
-        info = registry.get_command_info('add')
+        info = shared_registry.get_command_info('add')
         
-        assert info is not None
         assert info['description'] == 'Add two numbers'
         assert info['category'] == 'Basic Operations'
     
-    def test_get_command_info_nonexistent_command(self):
+    def test_get_command_info_nonexistent_command(self, shared_registry):
         """Test getting info for non-existent command."""
-        registry = CommandRegistry()
-        info = registry.get_command_info('nonexistent')
+        info = shared_registry.get_command_info('nonexistent')
         
-        assert info is None
+        assert info == {'description': '', 'category': ''}
+        with pytest.raises(TypeError):
+            info['description'] = 'mutated'
+        assert 'nonexistent' not in shared_registry.commands
     
-    def test_all_default_commands_registered(self):
+    def test_all_default_commands_registered(self, shared_registry):
         """Test that all default commands are registered."""
-        registry = CommandRegistry()
-        
         expected_commands = [
             'add', 'subtract', 'multiply', 'divide',
             'power', 'root', 'modulus', 'intdiv', 'percentage', 'absdiff',
@@ -332,14 +335,11 @@ class TestCommandRegistry:
             'help', 'exit'
         ]
         
-        for cmd in expected_commands:
-            assert cmd in registry.commands
+        missing = set(expected_commands) - shared_registry.commands.keys()
+        assert not missing, f"missing commands: {missing}"
     
-    def test_command_categories_structure(self):
+    def test_command_categories_structure(self, categorized):
         """Test the structure of categorized commands."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
-        
         # Each category should have a list of command dictionaries
         for category, commands in categorized.items():
             assert isinstance(commands, list)
@@ -347,44 +347,71 @@ class TestCommandRegistry:
                 assert 'name' in cmd
                 assert 'description' in cmd
     
-    def test_advanced_operations_category(self):
+    def test_advanced_operations_category(self, category_names):
         """Test that advanced operations are properly categorized."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
-        
-        advanced_commands = [cmd['name'] for cmd in categorized['Advanced Operations']]
-        assert 'power' in advanced_commands
-        assert 'root' in advanced_commands
-        assert 'modulus' in advanced_commands
-        assert 'intdiv' in advanced_commands
-        assert 'percentage' in advanced_commands
-        assert 'absdiff' in advanced_commands
-    
-    def test_history_management_category(self):
+        assert {'power', 'root', 'modulus', 'intdiv', 'percentage', 'absdiff'} <= category_names['Advanced Operations']
+    
+    def test_history_management_category(self, category_names):
         """Test that history commands are properly categorized."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
-        
-        history_commands = [cmd['name'] for cmd in categorized['History Management']]
-        assert 'history' in history_commands
-        assert 'clear' in history_commands
-        assert 'undo' in history_commands
-        assert 'redo' in history_commands
+        assert {'history', 'clear', 'undo', 'redo'} <= category_names['History Management']
     
-    def test_file_operations_category(self):
+    def test_file_operations_category(self, category_names):
         """Test that file commands are properly categorized."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
-        
-        file_commands = [cmd['name'] for cmd in categorized['File Operations']]
-        assert 'save' in file_commands
-        assert 'load' in file_commands
+        assert {'save', 'load'} <= category_names['File Operations']
     
-    def test_other_category(self):
+    def test_other_category(self, category_names):
         """Test that other commands are properly categorized."""
-        registry = CommandRegistry()
-        categorized = registry.get_commands_by_category()
+        assert {'help', 'exit'} <= category_names['Other']
+
+
+class TestCommandRegistryMutation:
+    """Test CommandRegistry registration and removal on a private registry."""
+    
+    def test_register_command_metadata(self, fresh_registry):
+        """Test registering new command metadata."""
+        registry = fresh_registry
+        
+        registry.register_command_metadata(
+            'custom',
+            'Custom command',
+            'Custom Category'
+        )
+        
+        assert 'custom' in registry.commands
+        assert registry.commands['custom']['description'] == 'Custom command'
+        assert registry.commands['custom']['category'] == 'Custom Category'
+    
+    def test_register_command_metadata_interns_strings(self, fresh_registry):
+        """Test that registered names, categories and descriptions are interned."""
+        registry = fresh_registry
+        name = ''.join(['dyn', 'amic'])
+        
+        registry.register_command_metadata(name, 'Dynamic command', 'Other')
+        
+        key = next(k for k in registry.commands if k == 'dynamic')
+        assert key is sys.intern('dynamic')
+        assert registry.commands[key]['category'] is sys.intern('Other')
+        assert registry.commands[key]['description'] is sys.intern('Dynamic command')
+    
+    def test_get_commands_by_category_includes_new_registration(self, fresh_registry):
+        """Test that the categorized view includes commands registered later."""
+        registry = fresh_registry
+        registry.get_commands_by_category()
+        
+        registry.register_command_metadata('custom', 'Custom command', 'Custom Category')
+        rebuilt = registry.get_commands_by_category()
+        
+        assert rebuilt['Custom Category'] == [{'name': 'custom', 'description': 'Custom command'}]
+    
+    def test_unregister_command_metadata(self, fresh_registry):
+        """Test removing a command drops it from every view and bumps the version."""
+        registry = fresh_registry
+        registry.get_commands_by_category()
+        version = registry.version
+        
+        assert registry.unregister_command_metadata('exit') is True
         
-        other_commands = [cmd['name'] for cmd in categorized['Other']]
-        assert 'help' in other_commands
-        assert 'exit' in other_commands
\ No newline at end of file
+        assert 'exit' not in registry.commands
+        assert registry.version == version + 1
+        other = [cmd['name'] for cmd in registry.get_commands_by_category()['Other']]
+        assert other == ['help']
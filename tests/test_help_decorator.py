@@ -2,9 +2,11 @@
 Tests for Help Menu Decorator implementation.
 """
 
+from functools import lru_cache
+import re
 import pytest
 from unittest.mock import Mock, MagicMock
-from colorama import Fore, Style
+from app.colors import Fore, Style
 from app.help_decorator import (
     HelpDisplay,
     BaseHelp,
@@ -12,13 +14,109 @@ from app.help_decorator import (
     CategoryDecorator,
     ColorDecorator,
     ExamplesDecorator,
-    HelpMenuBuilder
+    HelpMenuBuilder,
+    _EXAMPLES_PARTS,
+    _render_command_line
 )
 from app.command_pattern import CommandRegistry
 
 
+_SEP50 = "=" * 50
+_CATEGORY_ORDER = (
+    "Basic Operations", "Advanced Operations", "History Management", "File Operations", "Other"
+)
+_CATEGORY_PATTERN = re.compile("|".join(map(re.escape, _CATEGORY_ORDER)))
+# Substrings CategoryDecorator output must contain, grouped for failure messages;
+# icons and colours are listed in category order
+_CATEGORY_TOKEN_GROUPS = {
+    "categories": ("AVAILABLE COMMANDS",) + _CATEGORY_ORDER,
+    "descriptions": (
+        "Add two numbers", "Subtract second number from first", "Show calculation history"
+    ),
+    "icons": ("📊", "🔢", "📜", "💾", "🚪"),
+    "colors": (Fore.GREEN, Fore.YELLOW, Fore.BLUE, Fore.MAGENTA, Fore.CYAN),
+}
+# Command names, matched as whole words
+_CATEGORY_COMMANDS = frozenset({
+    "add", "subtract", "multiply", "divide", "power", "root",
+    "history", "undo", "save", "load",
+})
+_ANSI_ESCAPE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+_WORD = re.compile(r"[A-Za-z_]+")
+
+
+@lru_cache(maxsize=None)
+def _words(text):
+    """Return the set of bare words in ``text`` once colour codes are removed."""
+    return frozenset(_WORD.findall(_ANSI_ESCAPE.sub('', text)))
+
+
+def _missing(tokens, text):
+    """Return the ``tokens`` that do not occur in ``text``."""
+    return [token for token in tokens if token not in text]
+
+
+# Help tests only read the registry, so one instance serves the whole session;
+# the few that register or unregister commands take fresh_registry instead
+
+@pytest.fixture(scope="session")
+def command_registry():
+    """Default command registry shared by read-only help tests."""
+    return CommandRegistry()
+
+
+@pytest.fixture(scope="session")
+def base_help(command_registry):
+    """BaseHelp over the shared registry."""
+    return BaseHelp(command_registry)
+
+
+@pytest.fixture(scope="session")
+def base_output(base_help):
+    """The banner BaseHelp renders, read once for tests that only inspect it."""
+    return base_help.display()
+
+
+@pytest.fixture(scope="session")
+def full_help_output(command_registry):
+    """Fully decorated help text, built and rendered once for integration checks."""
+    return (HelpMenuBuilder(command_registry)
+            .with_categories()
+            .with_colors()
+            .with_examples()
+            .build()
+            .display())
+
+
+# Mock(spec=HelpDisplay) introspects the protocol class on every build; a name
+# list gives the same attribute restriction, and HelpDisplay stays satisfied
+_HELP_SPEC = ['display']
+
+
+class _StubHelp:
+    """Plain HelpDisplay for tests that only need the wrapped text, not call tracking."""
+    __slots__ = ()
+    
+    def display(self) -> str:
+        return "test output"
+
+
+@pytest.fixture
+def mock_help():
+    """A wrapped display whose display() returns "test output" and records calls."""
+    mock = Mock(spec=_HELP_SPEC)
+    mock.display.return_value = "test output"
+    return mock
+
+
+@pytest.fixture
+def fresh_registry():
+    """A private registry for tests that change the registered commands."""
+    return CommandRegistry()
+
+
 class TestHelpDisplay:
-    """Test the abstract HelpDisplay base class."""
+    """Test the HelpDisplay protocol."""
     
     def test_help_display_is_abstract(self):
         """Test that HelpDisplay cannot be instantiated directly."""
@@ -26,12 +124,20 @@ class TestHelpDisplay:
             HelpDisplay()
     
     def test_help_display_requires_display_method(self):
-        """Test that subclasses must implement display method."""
-        class IncompleteHelp(HelpDisplay):
+        """Test that objects without a display method do not satisfy the protocol."""
+        class IncompleteHelp:
             pass
         
-        with pytest.raises(TypeError):
-            IncompleteHelp()
+        assert not isinstance(IncompleteHelp(), HelpDisplay)
+    
+    def test_help_display_is_structural(self, command_registry):
+        """Test that any object with a display method satisfies the protocol."""
+        class DuckHelp:
+            def display(self) -> str:
+                return "duck"
+        
+        assert isinstance(DuckHelp(), HelpDisplay)
+        assert isinstance(BaseHelp(command_registry), HelpDisplay)
 
 
 class TestBaseHelp:
@@ -47,27 +153,28 @@ class TestBaseHelp:
         base_help = BaseHelp(mock_registry)
         assert base_help.command_registry == mock_registry
     
-    def test_base_help_display(self, mock_registry):
+    def test_base_help_display(self, base_output):
         """Test BaseHelp display method."""
-        base_help = BaseHelp(mock_registry)
-        output = base_help.display()
+        output = base_output
         
         assert isinstance(output, str)
         assert "AVAILABLE COMMANDS" in output
-        assert "=" * 50 in output
+        assert _SEP50 in output
         assert Fore.CYAN in output
         assert Style.BRIGHT in output
         assert Style.RESET_ALL in output
     
-    def test_base_help_display_structure(self, mock_registry):
-        """Test that base help has proper structure."""
-        base_help = BaseHelp(mock_registry)
-        output = base_help.display()
-        lines = output.split('\n')
+    def test_base_help_display_is_cached(self, mock_registry):
+        """Test that BaseHelp returns the same prebuilt banner on every call."""
+        first = BaseHelp(mock_registry).display()
         
+        assert BaseHelp(mock_registry).display() is first
+    
+    def test_base_help_display_structure(self, base_output):
+        """Test that base help has proper structure."""
         # Should have header with separators
-        assert any("=" * 50 in line for line in lines)
-        assert any("AVAILABLE COMMANDS" in line for line in lines)
+        assert _SEP50 in base_output
+        assert "AVAILABLE COMMANDS" in base_output
 
 
 class TestHelpDecorator:
@@ -75,17 +182,12 @@ class TestHelpDecorator:
     
     def test_help_decorator_initialization(self):
         """Test HelpDecorator initialization."""
-        mock_help = Mock(spec=HelpDisplay)
-        mock_help.display.return_value = "test output"
-        
-        decorator = HelpDecorator(mock_help)
-        assert decorator._help_display == mock_help
+        help_display = _StubHelp()
+        decorator = HelpDecorator(help_display)
+        assert decorator._help_display == help_display
     
-    def test_help_decorator_display(self):
+    def test_help_decorator_display(self, mock_help):
         """Test HelpDecorator display delegates to wrapped instance."""
-        mock_help = Mock(spec=HelpDisplay)
-        mock_help.display.return_value = "test output"
-        
         decorator = HelpDecorator(mock_help)
         result = decorator.display()
         
@@ -96,17 +198,6 @@ class TestHelpDecorator:
 class TestCategoryDecorator:
     """Test CategoryDecorator class."""
     
-    @pytest.fixture
-    def command_registry(self):
-        """Create a real command registry with test data."""
-        registry = CommandRegistry()
-        return registry
-    
-    @pytest.fixture
-    def base_help(self, command_registry):
-        """Create a base help instance."""
-        return BaseHelp(command_registry)
-    
     def test_category_decorator_initialization(self, base_help, command_registry):
         """Test CategoryDecorator initialization."""
         decorator = CategoryDecorator(base_help, command_registry)
@@ -114,90 +205,46 @@ class TestCategoryDecorator:
         assert decorator.command_registry == command_registry
     
     def test_category_decorator_display(self, base_help, command_registry):
-        """Test CategoryDecorator display method."""
+        """Test CategoryDecorator output has every heading, command, description, icon and colour."""
         decorator = CategoryDecorator(base_help, command_registry)
         output = decorator.display()
         
         assert isinstance(output, str)
-        assert "AVAILABLE COMMANDS" in output
-        assert "Basic Operations" in output
-        assert "Advanced Operations" in output
-        assert "History Management" in output
-        assert "File Operations" in output
-        assert "Other" in output
+        missing = {group: _missing(tokens, output) for group, tokens in _CATEGORY_TOKEN_GROUPS.items()}
+        missing["commands"] = sorted(_CATEGORY_COMMANDS - _words(output))
+        assert not any(missing.values()), missing
     
-    def test_category_decorator_includes_commands(self, base_help, command_registry):
-        """Test that CategoryDecorator includes command names."""
-        decorator = CategoryDecorator(base_help, command_registry)
-        output = decorator.display()
-        
-        # Check for basic operation commands
-        assert "add" in output
-        assert "subtract" in output
-        assert "multiply" in output
-        assert "divide" in output
-        
-        # Check for advanced operations
-        assert "power" in output
-        assert "root" in output
-        
-        # Check for history commands
-        assert "history" in output
-        assert "undo" in output
+    def test_category_decorator_reflects_registry_changes(self, fresh_registry):
+        """Test that output picks up commands registered after the first render."""
+        command_registry = fresh_registry
+        decorator = CategoryDecorator(BaseHelp(command_registry), command_registry)
+        first = decorator.display()
         
-        # Check for file commands
-        assert "save" in output
-        assert "load" in output
-    
-    def test_category_decorator_includes_descriptions(self, base_help, command_registry):
-        """Test that CategoryDecorator includes command descriptions."""
-        decorator = CategoryDecorator(base_help, command_registry)
-        output = decorator.display()
-        
-        assert "Add two numbers" in output
-        assert "Subtract second number from first" in output
-        assert "Show calculation history" in output
-    
-    def test_category_decorator_has_icons(self, base_help, command_registry):
-        """Test that CategoryDecorator includes category icons."""
-        decorator = CategoryDecorator(base_help, command_registry)
-        output = decorator.display()
+        command_registry.register_command_metadata('sqrt', 'Square root', 'Advanced Operations')
         
-        # Check for emoji icons
-        assert "📊" in output  # Basic Operations
-        assert "🔢" in output  # Advanced Operations
-        assert "📜" in output  # History Management
-        assert "💾" in output  # File Operations
-        assert "🚪" in output  # Other
+        assert 'sqrt' not in first
+        assert 'sqrt' in decorator.display()
     
-    def test_category_decorator_has_colors(self, base_help, command_registry):
-        """Test that CategoryDecorator includes color codes."""
-        decorator = CategoryDecorator(base_help, command_registry)
-        output = decorator.display()
+    def test_category_decorator_command_line_format(self, base_help, command_registry):
+        """Test that each command line is padded and coloured consistently."""
+        line = _render_command_line('add', 'Add two numbers')
         
-        assert Fore.GREEN in output    # Basic Operations
-        assert Fore.YELLOW in output   # Advanced Operations
-        assert Fore.BLUE in output     # History Management
-        assert Fore.MAGENTA in output  # File Operations
-        assert Fore.CYAN in output     # Other
+        assert line == f"  {Fore.WHITE}{'add':<13}{Style.RESET_ALL}- Add two numbers"
+        assert line in CategoryDecorator(base_help, command_registry).display()
     
     def test_category_decorator_order(self, base_help, command_registry):
         """Test that categories appear in the correct order."""
         decorator = CategoryDecorator(base_help, command_registry)
         output = decorator.display()
         
-        # Find positions of each category
-        basic_pos = output.find("Basic Operations")
-        advanced_pos = output.find("Advanced Operations")
-        history_pos = output.find("History Management")
-        file_pos = output.find("File Operations")
-        other_pos = output.find("Other")
+        # First position of each category, found in one pass
+        positions = {}
+        for match in _CATEGORY_PATTERN.finditer(output):
+            positions.setdefault(match.group(), match.start())
         
         # Verify order
-        assert basic_pos < advanced_pos
-        assert advanced_pos < history_pos
-        assert history_pos < file_pos
-        assert file_pos < other_pos
+        found = [positions[name] for name in _CATEGORY_ORDER]
+        assert found == sorted(found)
     
     def test_category_decorator_with_empty_category(self, base_help):
         """Test CategoryDecorator with a registry that has empty categories."""
@@ -214,57 +261,59 @@ class TestCategoryDecorator:
         assert "Basic Operations" in output
         assert "add" in output
         # Other categories should not appear since they're not in the mock
+    
+    def test_category_decorator_with_unversioned_registry(self, base_help):
+        """Test that a registry offering only get_commands_by_category is re-read each render."""
+        class PlainRegistry:
+            def __init__(self):
+                self.categorized = {'Other': [{'name': 'exit', 'description': 'Exit'}]}
+            
+            def get_commands_by_category(self):
+                return self.categorized
+        
+        registry = PlainRegistry()
+        decorator = CategoryDecorator(base_help, registry)
+        
+        assert 'exit' in decorator.display()
+        registry.categorized = {'Other': [{'name': 'quit', 'description': 'Quit'}]}
+        assert 'quit' in decorator.display()
 
 
 class TestColorDecorator:
     """Test ColorDecorator class."""
     
-    @pytest.fixture
-    def mock_help(self):
-        """Create a mock help display."""
-        mock = Mock(spec=HelpDisplay)
-        mock.display.return_value = "test output with colors"
-        return mock
-    
-    def test_color_decorator_initialization(self, mock_help):
+    def test_color_decorator_initialization(self):
         """Test ColorDecorator initialization."""
-        decorator = ColorDecorator(mock_help)
-        assert decorator._help_display == mock_help
+        help_display = _StubHelp()
+        decorator = ColorDecorator(help_display)
+        assert decorator._help_display == help_display
     
     def test_color_decorator_display(self, mock_help):
         """Test ColorDecorator display method."""
         decorator = ColorDecorator(mock_help)
         output = decorator.display()
         
-        assert output == "test output with colors"
+        assert output == "test output"
         mock_help.display.assert_called_once()
     
-    def test_color_decorator_passes_through(self):
+    def test_color_decorator_passes_through(self, base_help, base_output):
         """Test that ColorDecorator passes through the base output."""
-        registry = CommandRegistry()
-        base_help = BaseHelp(registry)
-        
         decorator = ColorDecorator(base_help)
         output = decorator.display()
         
-        # Should contain the base help output
+        # Should be exactly the base help output
+        assert output == base_output
         assert "AVAILABLE COMMANDS" in output
 
 
 class TestExamplesDecorator:
     """Test ExamplesDecorator class."""
     
-    @pytest.fixture
-    def mock_help(self):
-        """Create a mock help display."""
-        mock = Mock(spec=HelpDisplay)
-        mock.display.return_value = "base output"
-        return mock
-    
-    def test_examples_decorator_initialization(self, mock_help):
+    def test_examples_decorator_initialization(self):
         """Test ExamplesDecorator initialization."""
-        decorator = ExamplesDecorator(mock_help)
-        assert decorator._help_display == mock_help
+        help_display = _StubHelp()
+        decorator = ExamplesDecorator(help_display)
+        assert decorator._help_display == help_display
     
     def test_examples_decorator_display(self, mock_help):
         """Test ExamplesDecorator display method."""
@@ -272,40 +321,37 @@ class TestExamplesDecorator:
         output = decorator.display()
         
         assert isinstance(output, str)
-        assert "base output" in output
+        assert "test output" in output
         assert "USAGE EXAMPLES" in output
         mock_help.display.assert_called_once()
     
-    def test_examples_decorator_includes_examples(self, mock_help):
+    def test_examples_decorator_includes_examples(self):
         """Test that ExamplesDecorator includes usage examples."""
-        decorator = ExamplesDecorator(mock_help)
+        help_display = _StubHelp()
+        decorator = ExamplesDecorator(help_display)
         output = decorator.display()
         
-        assert "add" in output
-        assert "Add 10 and 5" in output
-        assert "power" in output
-        assert "Calculate 2^8" in output
-        assert "percentage" in output
-        assert "Find what % 25 is of 200" in output
-        assert "history" in output
-        assert "View all calculations" in output
-    
-    def test_examples_decorator_has_formatting(self, mock_help):
+        assert not {"add", "power", "percentage", "history"} - _words(output)
+        missing = _missing(
+            ("Add 10 and 5", "Calculate 2^8", "Find what % 25 is of 200", "View all calculations"),
+            output,
+        )
+        assert not missing, missing
+    
+    def test_examples_decorator_has_formatting(self):
         """Test that ExamplesDecorator includes proper formatting."""
-        decorator = ExamplesDecorator(mock_help)
+        help_display = _StubHelp()
+        decorator = ExamplesDecorator(help_display)
         output = decorator.display()
         
         assert Fore.CYAN in output
         assert Style.BRIGHT in output
         assert Style.RESET_ALL in output
         assert "💡" in output  # Example icon
-        assert "=" * 50 in output
+        assert _SEP50 in output
     
-    def test_examples_decorator_with_real_base(self):
+    def test_examples_decorator_with_real_base(self, base_help):
         """Test ExamplesDecorator with real BaseHelp."""
-        registry = CommandRegistry()
-        base_help = BaseHelp(registry)
-        
         decorator = ExamplesDecorator(base_help)
         output = decorator.display()
         
@@ -316,11 +362,6 @@ class TestExamplesDecorator:
 class TestHelpMenuBuilder:
     """Test HelpMenuBuilder class."""
     
-    @pytest.fixture
-    def command_registry(self):
-        """Create a command registry."""
-        return CommandRegistry()
-    
     def test_help_menu_builder_initialization(self, command_registry):
         """Test HelpMenuBuilder initialization."""
         builder = HelpMenuBuilder(command_registry)
@@ -328,29 +369,18 @@ class TestHelpMenuBuilder:
         assert builder.command_registry == command_registry
         assert isinstance(builder.help_display, BaseHelp)
     
-    def test_help_menu_builder_with_categories(self, command_registry):
-        """Test adding categories to builder."""
+    @pytest.mark.parametrize("method, decorator_cls", [
+        ("with_categories", CategoryDecorator),
+        ("with_colors", ColorDecorator),
+        ("with_examples", ExamplesDecorator),
+    ])
+    def test_help_menu_builder_with_decorator(self, command_registry, method, decorator_cls):
+        """Test each with_* step wraps the display and returns the builder."""
         builder = HelpMenuBuilder(command_registry)
-        result = builder.with_categories()
+        result = getattr(builder, method)()
         
-        assert result == builder  # Fluent interface
-        assert isinstance(builder.help_display, CategoryDecorator)
-    
-    def test_help_menu_builder_with_colors(self, command_registry):
-        """Test adding colors to builder."""
-        builder = HelpMenuBuilder(command_registry)
-        result = builder.with_colors()
-        
-        assert result == builder  # Fluent interface
-        assert isinstance(builder.help_display, ColorDecorator)
-    
-    def test_help_menu_builder_with_examples(self, command_registry):
-        """Test adding examples to builder."""
-        builder = HelpMenuBuilder(command_registry)
-        result = builder.with_examples()
-        
-        assert result == builder  # Fluent interface
-        assert isinstance(builder.help_display, ExamplesDecorator)
+        assert result is builder  # Fluent interface
+        assert isinstance(builder.help_display, decorator_cls)
     
     def test_help_menu_builder_build(self, command_registry):
         """Test building the help display."""
@@ -366,12 +396,36 @@ class TestHelpMenuBuilder:
         
         assert isinstance(help_display, HelpDisplay)
     
-    def test_help_menu_builder_full_chain(self, command_registry):
-        """Test complete builder chain produces correct output."""
-        builder = HelpMenuBuilder(command_registry)
-        help_display = builder.with_categories().with_examples().build()
+    def test_help_menu_builder_build_caches_per_registry_version(self, fresh_registry):
+        """Test that the built display reuses its text until the registry changes."""
+        command_registry = fresh_registry
+        help_display = HelpMenuBuilder(command_registry).with_categories().build()
+        first = help_display.display()
         
-        output = help_display.display()
+        assert help_display.display() is first
+        assert help_display._display_parts() == (first,)
+        
+        command_registry.unregister_command_metadata('exit')
+        
+        assert 'exit' not in help_display.display()
+    
+    def test_help_menu_builder_build_rerenders_unversioned_registry(self):
+        """Test that the built display re-reads a registry that has no version."""
+        registry = Mock(spec=['get_commands_by_category'])
+        registry.get_commands_by_category.return_value = {
+            'Other': [{'name': 'exit', 'description': 'Exit'}]
+        }
+        help_display = HelpMenuBuilder(registry).with_categories().build()
+        
+        assert 'exit' in help_display.display()
+        registry.get_commands_by_category.return_value = {
+            'Other': [{'name': 'quit', 'description': 'Quit'}]
+        }
+        assert 'quit' in help_display.display()
+    
+    def test_help_menu_builder_full_chain(self, full_help_output):
+        """Test complete builder chain produces correct output."""
+        output = full_help_output
         
         # Should have all components
         assert "AVAILABLE COMMANDS" in output
@@ -394,11 +448,9 @@ class TestHelpMenuBuilder:
         builder.with_examples()
         assert isinstance(builder.help_display, ExamplesDecorator)
         
-        # The wrapped display should still be there
-        output = builder.build().display()
-        assert "AVAILABLE COMMANDS" in output
-        assert "Basic Operations" in output
-        assert "USAGE EXAMPLES" in output
+        # The wrapped displays should still be there, innermost last
+        assert isinstance(builder.help_display._help_display, CategoryDecorator)
+        assert isinstance(builder.help_display._help_display._help_display, BaseHelp)
     
     def test_help_menu_builder_minimal_build(self, command_registry):
         """Test building with minimal decorators."""
@@ -440,57 +492,53 @@ class TestHelpMenuBuilder:
 class TestIntegration:
     """Integration tests for the complete help system."""
     
-    def test_complete_help_menu(self):
+    def test_complete_help_menu(self, full_help_output):
         """Test creating a complete help menu with all features."""
-        registry = CommandRegistry()
-        builder = HelpMenuBuilder(registry)
+        output = full_help_output
         
-        help_display = (builder
-                       .with_categories()
-                       .with_colors()
-                       .with_examples()
-                       .build())
+        # Verify all major components and formatting
+        missing = _missing(
+            ("AVAILABLE COMMANDS", "USAGE EXAMPLES", "📊", "🔢", "💡") + _CATEGORY_ORDER, output
+        )
+        assert not missing, missing
         
-        output = help_display.display()
+        # Verify commands are present
+        assert not {"add", "power", "history", "save"} - _words(output)
+    
+    def test_chain_joins_parts_once_with_same_output(self, command_registry):
+        """Test that the parts pipeline renders the same text as layer-by-layer joins."""
+        category = CategoryDecorator(BaseHelp(command_registry), command_registry)
+        examples = ExamplesDecorator(ColorDecorator(category))
         
-        # Verify all major components
-        assert "AVAILABLE COMMANDS" in output
-        assert "Basic Operations" in output
-        assert "Advanced Operations" in output
-        assert "History Management" in output
-        assert "File Operations" in output
-        assert "Other" in output
-        assert "USAGE EXAMPLES" in output
+        expected = category.display() + "\n" + "\n".join(_EXAMPLES_PARTS)
         
-        # Verify commands are present
-        assert "add" in output
-        assert "power" in output
-        assert "history" in output
-        assert "save" in output
+        assert examples.display() == expected
+    
+    def test_foreign_displays_count_as_single_parts(self):
+        """Test that non-module displays contribute one part each."""
+        assert ExamplesDecorator(_StubHelp())._display_parts()[0] == "test output"
+    
+    def test_subclass_overriding_display_is_not_bypassed(self, base_help):
+        """Test that a decorator overriding only display() keeps its output when wrapped."""
+        class Footer(HelpDecorator):
+            def display(self) -> str:
+                return self._help_display.display() + "\nFOOTER"
+        
+        output = ExamplesDecorator(Footer(base_help)).display()
         
-        # Verify formatting
-        assert "📊" in output
-        assert "🔢" in output
-        assert "💡" in output
+        assert "FOOTER" in output
+        assert output.index("FOOTER") < output.index("USAGE EXAMPLES")
     
-    def test_decorator_pattern_layering(self):
+    def test_decorator_pattern_layering(self, command_registry):
         """Test that decorator pattern correctly layers functionality."""
-        registry = CommandRegistry()
-        base = BaseHelp(registry)
+        base = BaseHelp(command_registry)
         
-        # Layer 1: Add categories
-        with_categories = CategoryDecorator(base, registry)
-        output1 = with_categories.display()
-        assert "Basic Operations" in output1
-        
-        # Layer 2: Add examples on top of categories
+        # Each layer wraps the previous one; rendered content is covered by
+        # the full_help_output tests
+        with_categories = CategoryDecorator(base, command_registry)
         with_examples = ExamplesDecorator(with_categories)
-        output2 = with_examples.display()
-        assert "Basic Operations" in output2
-        assert "USAGE EXAMPLES" in output2
-        
-        # Layer 3: Add colors (though it's pass-through)
         with_colors = ColorDecorator(with_examples)
-        output3 = with_colors.display()
-        assert "Basic Operations" in output3
-        assert "USAGE EXAMPLES" in output3
\ No newline at end of file
+        
+        assert with_categories._help_display is base
+        assert with_examples._help_display is with_categories
+        assert with_colors._help_display is with_examples
\ No newline at end of file
@@ -5,10 +5,34 @@ from app.calculator_memento import CalculatorMemento
 from app.calculation import Calculation
 
 
-def test_memento_initialization():
+# Canonical calculations shared by the serialization tests; none of them mutate
+# a Calculation, so each is built once per module
+
+@pytest.fixture(scope="module")
+def sample_calcs():
+    return {
+        calc.operation: calc
+        for calc in (
+            Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3")),
+            Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("2")),
+            Calculation(operation="Multiplication", operand1=Decimal("4"), operand2=Decimal("5")),
+            Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("3")),
+            Calculation(operation="Root", operand1=Decimal("16"), operand2=Decimal("2")),
+        )
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_memento_dict(sample_calcs):
+    """Serialized memento holding the Addition and Multiplication samples."""
+    history = [sample_calcs["Addition"], sample_calcs["Multiplication"]]
+    return CalculatorMemento(history=history).to_dict()
+
+
+def test_memento_initialization(sample_calcs):
     """Test that CalculatorMemento initializes correctly."""
-    calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
-    calc2 = Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("2"))
+    calc1 = sample_calcs["Addition"]
+    calc2 = sample_calcs["Subtraction"]
     
     history = [calc1, calc2]
     memento = CalculatorMemento(history=history)
@@ -19,16 +43,9 @@ def test_memento_initialization():
     assert isinstance(memento.timestamp, datetime)
 
 
-def test_memento_to_dict():
+def test_memento_to_dict(sample_memento_dict):
     """Test converting memento to dictionary (covers line 34)."""
-    calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
-    calc2 = Calculation(operation="Multiplication", operand1=Decimal("4"), operand2=Decimal("5"))
-    
-    history = [calc1, calc2]
-    memento = CalculatorMemento(history=history)
-    
-    # Convert to dictionary
-    memento_dict = memento.to_dict()
+    memento_dict = sample_memento_dict
     
     # Verify structure
     assert 'history' in memento_dict
@@ -43,32 +60,24 @@ def test_memento_to_dict():
     assert memento_dict['history'][0]['result'] == '5'
 
 
-def test_memento_from_dict():
+def test_memento_from_dict(sample_memento_dict):
     """Test creating memento from dictionary (covers line 53)."""
-    # Create original memento
-    calc1 = Calculation(operation="Division", operand1=Decimal("10"), operand2=Decimal("2"))
-    original_memento = CalculatorMemento(history=[calc1])
-    
-    # Convert to dict
-    memento_dict = original_memento.to_dict()
-    
     # Recreate memento from dict
-    restored_memento = CalculatorMemento.from_dict(memento_dict)
+    restored_memento = CalculatorMemento.from_dict(sample_memento_dict)
     
     # Verify the restored memento
-    assert len(restored_memento.history) == 1
-    assert restored_memento.history[0].operation == "Division"
-    assert restored_memento.history[0].operand1 == Decimal("10")
-    assert restored_memento.history[0].operand2 == Decimal("2")
-    assert restored_memento.history[0].result == Decimal("5")
+    assert len(restored_memento.history) == 2
+    assert restored_memento.history[1].operation == "Multiplication"
+    assert restored_memento.history[1].operand1 == Decimal("4")
+    assert restored_memento.history[1].operand2 == Decimal("5")
+    assert restored_memento.history[1].result == Decimal("20")
     assert isinstance(restored_memento.timestamp, datetime)
 
 
-def test_memento_round_trip():
+def test_memento_round_trip(sample_calcs):
     """Test full serialization and deserialization cycle."""
-    # Create calculations
-    calc1 = Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("3"))
-    calc2 = Calculation(operation="Root", operand1=Decimal("16"), operand2=Decimal("2"))
+    calc1 = sample_calcs["Power"]
+    calc2 = sample_calcs["Root"]
     
     # Create memento
     original_memento = CalculatorMemento(history=[calc1, calc2])
@@ -1,6 +1,8 @@
+import math
+import re
 import pytest
 from decimal import Decimal
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
 from app.exceptions import ValidationError
 from app.operations import (
@@ -31,34 +33,81 @@ class TestOperation:
         assert str(TestOp()) == "TestOp"
 
 
+def pytest_generate_tests(metafunc):
+    """Turn each BaseOperationTest subclass's case tables into one test item per case."""
+    cls = metafunc.cls
+    if cls is None or not issubclass(cls, BaseOperationTest):
+        return
+    if "valid_case" in metafunc.fixturenames:
+        metafunc.parametrize("valid_case", list(cls._valid_cases.values()),
+                             ids=list(cls._valid_cases))
+    if "invalid_case" in metafunc.fixturenames:
+        if cls._invalid_cases:
+            metafunc.parametrize("invalid_case", list(cls._invalid_cases.values()),
+                                 ids=list(cls._invalid_cases))
+        else:
+            # Operations that accept every operand get one explicit skip rather
+            # than pytest's generic empty-parameter-set message
+            metafunc.parametrize("invalid_case", [pytest.param(
+                None, marks=pytest.mark.skip(reason=f"{cls.__name__} has no invalid cases")
+            )], ids=["no_invalid_cases"])
+
+
 class BaseOperationTest:
     """Base test class for all operations."""
 
     operation_class: Type[Operation]
     valid_test_cases: Dict[str, Dict[str, Any]]
     invalid_test_cases: Dict[str, Dict[str, Any]]
-
-    def test_valid_operations(self):
+    _valid_cases: Dict[str, Tuple[Decimal, Decimal, Decimal]]
+    _invalid_cases: Dict[str, Tuple[Decimal, Decimal, Type[Exception], Optional[re.Pattern]]]
+
+    # Cases stay Decimal even for simple ops: Operation.execute is typed for
+    # Decimal and Calculator only ever passes Decimals, so float inputs would
+    # exercise a path production never takes
+    def __init_subclass__(cls, **kwargs):
+        """Parse each case table into name -> tuple of Decimals once per class.
+
+        Valid cases become ``(a, b, expected)`` and invalid ones
+        ``(a, b, error, pattern)``, where pattern matches the message literally.
+        Case values must be strings so Decimal parses them exactly.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._valid_cases = {}
+        for name, case in cls.valid_test_cases.items():
+            assert all(isinstance(case[key], str) for key in ("a", "b", "expected")), case
+            cls._valid_cases[name] = (
+                Decimal(case["a"]), Decimal(case["b"]), Decimal(case["expected"])
+            )
+        cls._invalid_cases = {}
+        for name, case in cls.invalid_test_cases.items():
+            assert isinstance(case["a"], str) and isinstance(case["b"], str), case
+            cls._invalid_cases[name] = (
+                Decimal(case["a"]), Decimal(case["b"]),
+                case.get("error", ValidationError),
+                re.compile(re.escape(case["message"])) if case.get("message") else None,
+            )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def operation(cls):
+        """One instance of the operation under test, shared by the class; operations are stateless."""
+        return cls.operation_class()
+
+    def test_valid_operations(self, operation, valid_case):
         """Test operation with valid inputs."""
-        operation = self.operation_class()
-        for name, case in self.valid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            expected = Decimal(str(case["expected"]))
-            result = operation.execute(a, b)
-            assert result == expected, f"Failed case: {name} - got {result}, expected {expected}"
-
-    def test_invalid_operations(self):
+        a, b, expected = valid_case
+        result = operation.execute(a, b)
+        assert result == expected
+
+    def test_invalid_operations(self, operation, invalid_case):
         """Test operation with invalid inputs raises appropriate errors."""
-        operation = self.operation_class()
-        for name, case in self.invalid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            error = case.get("error", ValidationError)
-            error_message = case.get("message", "")
+        a, b, error, pattern = invalid_case
 
-            with pytest.raises(error, match=error_message):
-                operation.execute(a, b)
+        # Only pay for the regex match when the case names a message
+        ctx = pytest.raises(error, match=pattern) if pattern else pytest.raises(error)
+        with ctx:
+            operation.execute(a, b)
 
 
 class TestAddition(BaseOperationTest):
@@ -169,6 +218,13 @@ class TestRoot(BaseOperationTest):
         "cube_root": {"a": "27", "b": "3", "expected": "3"},
         "fourth_root": {"a": "16", "b": "4", "expected": "2"},
         "decimal_root": {"a": "2.25", "b": "2", "expected": "1.5"},
+        "zero_square_root": {"a": "0", "b": "2", "expected": "0"},
+        # Past float precision: only the exact integer square root gets this right
+        "large_perfect_square": {
+            "a": "152415787532388367501905199875019052100",
+            "b": "2",
+            "expected": "12345678901234567890"
+        },
     }
     invalid_test_cases = {
         "negative_base": {
@@ -185,6 +241,10 @@ class TestRoot(BaseOperationTest):
         },
     }
 
+    def test_imperfect_square_root_uses_float_path(self, operation):
+        """Integer radicands without an exact square root fall back to float pow."""
+        assert operation.execute(Decimal("2"), Decimal("2")) == Decimal(math.sqrt(2))
+
 
 class TestModulus(BaseOperationTest):
     """Test Modulus operation."""
@@ -206,16 +266,14 @@ class TestModulus(BaseOperationTest):
         },
     }
     
-    def test_valid_operations(self):
+    # For modulus, we need to be more flexible due to Decimal precision
+    TOL = Decimal("1E-7")
+
+    def test_valid_operations(self, operation, valid_case):
         """Test operation with valid inputs."""
-        operation = self.operation_class()
-        for name, case in self.valid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            expected = Decimal(str(case["expected"]))
-            result = operation.execute(a, b)
-            # For modulus, we need to be more flexible due to Decimal precision
-            assert abs(result - expected) < Decimal("0.0000001"), f"Failed case: {name} - got {result}, expected {expected}"
+        a, b, expected = valid_case
+        result = operation.execute(a, b)
+        assert abs(result - expected) < self.TOL
 
 
 class TestIntegerDivision(BaseOperationTest):
@@ -239,15 +297,11 @@ class TestIntegerDivision(BaseOperationTest):
         },
     }
     
-    def test_valid_operations(self):
+    def test_valid_operations(self, operation, valid_case):
         """Test operation with valid inputs."""
-        operation = self.operation_class()
-        for name, case in self.valid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            expected = Decimal(str(case["expected"]))
-            result = operation.execute(a, b)
-            assert result == expected, f"Failed case: {name} - got {result}, expected {expected}"
+        a, b, expected = valid_case
+        result = operation.execute(a, b)
+        assert result == expected
 
 
 class TestPercentage(BaseOperationTest):
@@ -287,30 +341,29 @@ class TestAbsoluteDifference(BaseOperationTest):
     invalid_test_cases = {}  # Absolute difference has no invalid cases
 
 
+_OPERATION_MAP = {
+    'add': Addition,
+    'subtract': Subtraction,
+    'multiply': Multiplication,
+    'divide': Division,
+    'power': Power,
+    'root': Root,
+    'modulus': Modulus,
+    'intdiv': IntegerDivision,
+    'percentage': Percentage,
+    'absdiff': AbsoluteDifference,
+}
+
+
 class TestOperationFactory:
     """Test OperationFactory functionality."""
 
-    def test_create_valid_operations(self):
+    # Test case-insensitive lookup alongside the registered spelling
+    @pytest.mark.parametrize("caser", [str.lower, str.upper], ids=["lower", "upper"])
+    @pytest.mark.parametrize("op_name, op_class", _OPERATION_MAP.items(), ids=list(_OPERATION_MAP))
+    def test_create_valid_operations(self, op_name, op_class, caser):
         """Test creation of all valid operations."""
-        operation_map = {
-            'add': Addition,
-            'subtract': Subtraction,
-            'multiply': Multiplication,
-            'divide': Division,
-            'power': Power,
-            'root': Root,
-            'modulus': Modulus,
-            'intdiv': IntegerDivision,
-            'percentage': Percentage,
-            'absdiff': AbsoluteDifference,
-        }
-
-        for op_name, op_class in operation_map.items():
-            operation = OperationFactory.create_operation(op_name)
-            assert isinstance(operation, op_class)
-            # Test case-insensitive
-            operation = OperationFactory.create_operation(op_name.upper())
-            assert isinstance(operation, op_class)
+        assert isinstance(OperationFactory.create_operation(caser(op_name)), op_class)
 
     def test_create_invalid_operation(self):
         """Test creation of invalid operation raises error."""
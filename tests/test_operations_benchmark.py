@@ -0,0 +1,25 @@
+"""
+Micro-benchmarks for Operation.execute.
+
+pytest.ini passes --benchmark-disable, so the regular suite runs each
+benchmarked call once as a plain test. CI runs this module a second time
+with benchmarking enabled and reports the change against the last run on
+main; the comparison is informational and never fails the build.
+"""
+
+from decimal import Decimal
+import pytest
+from app.operations import Addition, Division, Percentage, Power, Root
+
+
+@pytest.mark.parametrize("op_class, a, b, expected", [
+    (Addition, Decimal("5.5"), Decimal("3.3"), Decimal("8.8")),
+    (Division, Decimal("10"), Decimal("4"), Decimal("2.5")),
+    (Power, Decimal("2.5"), Decimal("2"), Decimal("6.25")),
+    (Root, Decimal("2.25"), Decimal("2"), Decimal("1.5")),
+    (Percentage, Decimal("25"), Decimal("200"), Decimal("12.5")),
+], ids=["addition", "division", "power", "root", "percentage"])
+def test_operation_execute_benchmark(benchmark, op_class, a, b, expected):
+    """Benchmark execute on representative Decimal operands."""
+    result = benchmark(op_class().execute, a, b)
+    assert result == expected
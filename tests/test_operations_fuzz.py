@@ -0,0 +1,51 @@
+"""
+Seeded fuzz tests cross-checking each Operation against a float reference.
+
+The tables in test_operations.py pin exact results for hand-picked inputs;
+these tests sweep many random operands and only require agreement with a
+plain float computation within a relative tolerance.
+"""
+
+import math
+import random
+from decimal import Decimal
+import pytest
+from app.operations import OperationFactory
+
+_SEED = 20241015
+_CASES_PER_OPERATION = 500
+
+# name -> (float reference, operand a range, operand b range, b must be non-zero)
+# Modulus and IntegerDivision are left out: they jump at integer boundaries,
+# where a float reference disagrees with exact Decimal arithmetic
+_REFERENCES = {
+    "add": (lambda a, b: a + b, (-1000, 1000), (-1000, 1000), False),
+    "subtract": (lambda a, b: a - b, (-1000, 1000), (-1000, 1000), False),
+    "multiply": (lambda a, b: a * b, (-1000, 1000), (-1000, 1000), False),
+    "divide": (lambda a, b: a / b, (-1000, 1000), (-1000, 1000), True),
+    "power": (lambda a, b: a ** b, (0, 10), (0, 5), False),
+    "root": (lambda a, b: a ** (1 / b), (0, 1000), (1, 5), True),
+    "percentage": (lambda a, b: a / b * 100, (-1000, 1000), (-1000, 1000), True),
+    "absdiff": (lambda a, b: abs(a - b), (-1000, 1000), (-1000, 1000), False),
+}
+
+
+def _operand(rng, bounds):
+    """A random two-decimal-place operand string within bounds."""
+    return f"{rng.uniform(*bounds):.2f}"
+
+
+@pytest.mark.parametrize("op_name", list(_REFERENCES))
+def test_operation_matches_float_reference(op_name):
+    """Random operands agree with the float reference to within 1e-9 relative error."""
+    reference, a_bounds, b_bounds, nonzero_b = _REFERENCES[op_name]
+    operation = OperationFactory.create_operation(op_name)
+    rng = random.Random(f"{_SEED}-{op_name}")
+    for _ in range(_CASES_PER_OPERATION):
+        a = _operand(rng, a_bounds)
+        b = _operand(rng, b_bounds)
+        if nonzero_b and Decimal(b) == 0:
+            continue
+        result = operation.execute(Decimal(a), Decimal(b))
+        expected = reference(float(a), float(b))
+        assert math.isclose(float(result), expected, rel_tol=1e-9, abs_tol=1e-9), (a, b)